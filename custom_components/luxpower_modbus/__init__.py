@@ -1,33 +1,60 @@
 """The Luxpower Modbus RTU integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
+from collections.abc import Iterable
 from datetime import timedelta
-import struct
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PORT, CONF_SCAN_INTERVAL, CONF_SLAVE, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from pymodbus.client import ModbusSerialClient
+from homeassistant.util import slugify
 from pymodbus.exceptions import ConnectionException
 
 from .const import (
+    CONF_REGISTER_GROUPS,
+    DATA_SCHEDULER,
     DOMAIN,
-    HOLDING_REGISTERS_NUMBERS,
-    HOLDING_REGISTERS_SELECTS,
-    HOLDING_REGISTERS_SWITCHES,
-    INPUT_REGISTERS_SENSORS,
-    INPUT_REGISTERS_SENSORS_32BIT,
-    LuxpowerModbus32bitSensorEntityDescription,
+    RAW_READ_CACHE_TTL,
+    REGISTER_GROUP_TYPES,
+    LuxpowerModbusSensorEntityDescription,
 )
+from .parallel import ROLE_MASTER, LuxpowerModbusParallelSystem, parallel_state
+from .register_groups import (
+    number_descriptions,
+    select_descriptions,
+    sensor_descriptions,
+    switch_descriptions,
+)
+from .registers import LuxpowerModbusRegisters, register_span
+from .scheduler import LuxpowerModbusBus, LuxpowerModbusPollScheduler
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.NUMBER, Platform.SELECT, Platform.SWITCH]
 
 
+def entry_unique_id(port: str, slave_id: int) -> str:
+    """Return the unique ID of the entry for an inverter, scoped to its bus."""
+    return f"{DOMAIN}_{slugify(port)}_{slave_id}"
+
+
+def entry_device_key(entry: ConfigEntry) -> str | int:
+    """Return the key identifying an entry's device and entities.
+
+    Entries created before the port was part of the unique ID keep their
+    slave-only key, so their device and entity IDs do not change.
+    """
+    slave_id = entry.data[CONF_SLAVE]
+    if entry.unique_id == f"{DOMAIN}_{slave_id}":
+        return slave_id
+    return f"{slugify(entry.data[CONF_PORT])}_{slave_id}"
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Luxpower Modbus RTU from a config entry."""
     port = entry.data[CONF_PORT]
@@ -35,136 +62,231 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     baudrate = entry.data["baudrate"]
     scan_interval = entry.data[CONF_SCAN_INTERVAL]
 
-    client = ModbusSerialClient(
-        port=port,
-        baudrate=baudrate,
-        stopbits=1,
-        bytesize=8,
-        parity="N",
-        timeout=3,
-    )
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = LuxpowerModbusPollScheduler(hass)
+    # On reload the previous bus for this port may still be finishing its last cycle
+    await scheduler.async_wait_bus_closed(port)
+    bus = scheduler.async_get_bus(port, baudrate)
 
     coordinator = LuxpowerModbusDataCoordinator(
-        hass, client, slave_id, timedelta(seconds=scan_interval)
+        hass,
+        bus,
+        slave_id,
+        timedelta(seconds=scan_interval),
+        entry.options.get(CONF_REGISTER_GROUPS, []),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    scheduler.async_add_coordinator(coordinator)
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        _async_release_coordinator(hass, coordinator)
+        raise
+
+    state = parallel_state(coordinator)
+    if state and state.role == ROLE_MASTER and state.count > 1:
+        coordinator.parallel_system = LuxpowerModbusParallelSystem(hass, coordinator)
+        scheduler.async_add_parallel_system(coordinator.parallel_system)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    async_setup_services(hass)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when the enabled register groups change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator: LuxpowerModbusDataCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
-        coordinator.client.close()
+        _async_release_coordinator(hass, coordinator)
     return unload_ok
 
 
+def _async_release_coordinator(hass: HomeAssistant, coordinator: LuxpowerModbusDataCoordinator) -> None:
+    """Remove a coordinator from the poll scheduler.
+
+    The scheduler itself is kept, as it tracks released buses until they are closed.
+    """
+    scheduler: LuxpowerModbusPollScheduler = hass.data[DATA_SCHEDULER]
+    scheduler.async_remove_coordinator(coordinator)
+
+
 class LuxpowerModbusDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the inverter."""
 
-    def __init__(self, hass: HomeAssistant, client: ModbusSerialClient, slave_id: int, update_interval: timedelta) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        bus: LuxpowerModbusBus,
+        slave_id: int,
+        update_interval: timedelta,
+        register_groups: Iterable[str] = (),
+    ) -> None:
         """Initialize."""
-        self.client = client
+        self.bus = bus
         self.slave_id = slave_id
-        self.data: dict[str, any] = {}
-        self.lock = asyncio.Lock()
+        # Shared by every inverter on the same bus
+        self.lock = bus.lock
+        # A replayed capture is polled as much faster as it is replayed
+        self.poll_interval = update_interval.total_seconds() / bus.time_scale
+        self.parallel_system: LuxpowerModbusParallelSystem | None = None
 
+        # Curated sensors plus those of the optional register groups, widening the block reads to cover them
+        self.sensor_descriptions: list[LuxpowerModbusSensorEntityDescription] = list(sensor_descriptions())
+        input_descriptions = list(self.sensor_descriptions)
+        holding_descriptions = [*number_descriptions(), *select_descriptions(), *switch_descriptions()]
+        for group in register_groups:
+            descriptions = sensor_descriptions(group)
+            self.sensor_descriptions += descriptions
+            if REGISTER_GROUP_TYPES[group] == "input":
+                input_descriptions += descriptions
+            else:
+                holding_descriptions += descriptions
+        # Read in blocks of at most the Modbus limit of registers per request
+        self._blocks = [
+            *(("input", start, count) for start, count in register_span(input_descriptions)),
+            *(("holding", start, count) for start, count in register_span(holding_descriptions)),
+        ]
+        # Persistent register images; coordinator.data always refers to this object
+        self.registers = LuxpowerModbusRegisters(input_descriptions, holding_descriptions)
+        self._raw_cache: dict[tuple[str, int, int], tuple[float, list[int]]] = {}
+
+        # Refreshes are driven by the poll scheduler rather than a timer of our own
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=update_interval,
+            update_interval=None,
         )
 
-    def _read_registers(self, register_type: str, descriptions: list) -> dict | None:
+    @property
+    def client(self):
+        """Return the Modbus client of the bus, which changes while capturing."""
+        return self.bus.client
+
+    def _read_registers(self, register_type: str, start: int, count: int) -> list[int] | None:
         """Read a range of registers."""
-        if not descriptions:
-            return {}
-            
-        all_addresses = set()
-        for d in descriptions:
-            all_addresses.add(d.register_address)
-            if isinstance(d, LuxpowerModbus32bitSensorEntityDescription):
-                all_addresses.add(d.register_address + 1)
-        
-        if not all_addresses:
-            return {}
-            
-        min_addr = min(all_addresses)
-        max_addr = max(all_addresses)
-        count = max_addr - min_addr + 1
+        if not count:
+            return []
 
         try:
             if register_type == "input":
-                result = self.client.read_input_registers(min_addr, count, slave=self.slave_id)
+                result = self.client.read_input_registers(start, count, slave=self.slave_id)
             else:  # holding
-                result = self.client.read_holding_registers(min_addr, count, slave=self.slave_id)
+                result = self.client.read_holding_registers(start, count, slave=self.slave_id)
 
             if result.isError():
                 raise ConnectionException(f"Modbus error: {result}")
-            
-            data: dict[str, any] = {}
-            for desc in descriptions:
-                idx = desc.register_address - min_addr
-                
-                # For switches, we store the raw register value keyed by register address
-                if hasattr(desc, 'bit'): 
-                    data[f"register_{desc.register_address}"] = result.registers[idx]
-                    continue
-
-                if isinstance(desc, LuxpowerModbus32bitSensorEntityDescription):
-                    if (idx + 1) < len(result.registers):
-                        low_word = result.registers[idx]
-                        high_word = result.registers[idx + 1]
-                        # Inverter uses L/H byte order, so pack high word then low word for big-endian
-                        raw_val = struct.unpack('>I', struct.pack('>HH', high_word, low_word))[0]
-                    else:
-                        continue
-                else:
-                    raw_val = result.registers[idx]
-                
-                value = float(raw_val)
-                if hasattr(desc, 'value_fn') and desc.value_fn:
-                    value = desc.value_fn(raw_val)
-                else:
-                    value *= desc.scale
-                
-                data[desc.key] = value
-
-            return data
+
+            return result.registers[:count]
         except ConnectionException as e:
             _LOGGER.error("Error reading modbus registers: %s", e)
             return None  # Indicate error
 
-    async def _async_update_data(self) -> dict:
+    def _poll(self) -> list[tuple[str, int, list[int]]]:
+        """Connect, read all register blocks and disconnect in a single executor job."""
+        if not self.client.connect():
+            raise UpdateFailed("Failed to connect to Modbus device")
+        try:
+            results = []
+            for register_type, start, count in self._blocks:
+                words = self._read_registers(register_type, start, count)
+                if words is None:
+                    raise UpdateFailed("Failed to read registers")
+                results.append((register_type, start, words))
+            return results
+        finally:
+            if self.client.is_socket_open():
+                self.client.close()
+
+    async def _async_update_data(self) -> LuxpowerModbusRegisters:
         """Fetch data from inverter."""
         async with self.lock:
             try:
-                if not await self.hass.async_add_executor_job(self.client.connect):
-                    raise UpdateFailed("Failed to connect to Modbus device")
+                blocks = await self.hass.async_add_executor_job(self._poll)
+            except Exception as e:
+                raise UpdateFailed(f"Error communicating with inverter: {e}") from e
 
-                all_input_sensors = list(INPUT_REGISTERS_SENSORS) + list(INPUT_REGISTERS_SENSORS_32BIT)
-                all_holding_entities = list(HOLDING_REGISTERS_NUMBERS) + list(HOLDING_REGISTERS_SELECTS) + list(HOLDING_REGISTERS_SWITCHES)
+        # Applied in the event loop so entities never see a half-updated image
+        for register_type, start, words in blocks:
+            self.registers.bank(register_type).update(start, words)
+        return self.registers
 
-                input_data = await self.hass.async_add_executor_job(
-                    self._read_registers, "input", all_input_sensors
-                )
-                holding_data = await self.hass.async_add_executor_job(
-                    self._read_registers, "holding", all_holding_entities
-                )
+    def _read_raw(self, register_type: str, address: int, count: int) -> list[int] | None:
+        """Connect, read one range of registers and disconnect."""
+        if not self.client.connect():
+            _LOGGER.error("Failed to connect to Modbus device for reading")
+            return None
+        try:
+            return self._read_registers(register_type, address, count)
+        finally:
+            if self.client.is_socket_open():
+                self.client.close()
 
-                if input_data is None or holding_data is None:
-                    raise UpdateFailed("Failed to read registers")
+    def _write_raw(self, address: int, value: int) -> bool:
+        """Connect, write one holding register and disconnect."""
+        try:
+            if not self.client.connect():
+                _LOGGER.error("Failed to connect to Modbus device for writing")
+                return False
+            result = self.client.write_register(address, value, slave=self.slave_id)
+            if result.isError():
+                _LOGGER.error("Error writing to modbus register %s: %s", address, result)
+                return False
+            return True
+        except Exception as e:
+            _LOGGER.error("Error writing to modbus register %s: %s", address, e)
+            return False
+        finally:
+            if self.client.is_socket_open():
+                self.client.close()
 
-                return {**input_data, **holding_data}
-            except Exception as e:
-                raise UpdateFailed(f"Error communicating with inverter: {e}") from e
-            finally:
-                if self.client.is_socket_open():
-                    await self.hass.async_add_executor_job(self.client.close)
+    def _cached_raw(self, key: tuple[str, int, int]) -> list[int] | None:
+        """Return the words of a recent identical raw read, if still fresh."""
+        if (cached := self._raw_cache.get(key)) and time.monotonic() - cached[0] < RAW_READ_CACHE_TTL:
+            return cached[1]
+        return None
+
+    async def async_read_raw(self, register_type: str, address: int, count: int) -> tuple[list[int], bool]:
+        """Read arbitrary registers on demand, returning the words and whether they were cached."""
+        key = (register_type, address, count)
+        if (words := self._cached_raw(key)) is not None:
+            return words, True
+
+        async with self.bus.async_raw_request() as book_slot:
+            # An identical request may have completed while this one was queued
+            if (words := self._cached_raw(key)) is not None:
+                return words, True
+            book_slot()
+            words = await self.hass.async_add_executor_job(self._read_raw, register_type, address, count)
+        if words is None:
+            raise HomeAssistantError(f"Failed to read {register_type} registers {address}-{address + count - 1}")
+
+        now = time.monotonic()
+        self._raw_cache = {k: v for k, v in self._raw_cache.items() if now - v[0] < RAW_READ_CACHE_TTL}
+        self._raw_cache[key] = (now, words)
+        return words, False
+
+    async def async_write_raw(self, address: int, value: int) -> None:
+        """Write an arbitrary holding register on demand."""
+        async with self.bus.async_raw_request() as book_slot:
+            book_slot()
+            written = await self.hass.async_add_executor_job(self._write_raw, address, value)
+        if not written:
+            raise HomeAssistantError(f"Failed to write holding register {address}")
+
+        self._raw_cache = {
+            k: v for k, v in self._raw_cache.items()
+            if k[0] != "holding" or not k[1] <= address < k[1] + k[2]
+        }
+        await self.async_request_refresh()
@@ -7,20 +7,28 @@ from typing import Any
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_PORT, CONF_SCAN_INTERVAL, CONF_SLAVE
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.selector import (
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
     TextSelector,
 )
 
 from .const import (
+    CONF_REGISTER_GROUPS,
     DEFAULT_BAUDRATE,
     DEFAULT_POLL_INTERVAL,
     DEFAULT_SLAVE_ID,
     DOMAIN,
+    REGISTER_GROUP_TYPES,
 )
+from . import entry_unique_id
+from .discovery import DiscoveredInverter, async_discover_inverters, async_list_ports
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,20 +55,206 @@ class LuxpowerModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize."""
+        self._ports: list[str] = []
+        self._discovered: dict[str, DiscoveredInverter] = {}
+        self._discovery_data: dict[str, Any] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> LuxpowerModbusOptionsFlow:
+        """Return the options flow."""
+        return LuxpowerModbusOptionsFlow()
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the user step."""
+        return self.async_show_menu(step_id="user", menu_options=["discovery", "manual"])
+
+    async def async_step_manual(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Handle manually entered connection details."""
         errors: dict[str, str] = {}
         if user_input is not None:
-            # Using slave_id as part of the unique ID
-            unique_id = f"luxpower_modbus_{user_input[CONF_SLAVE]}"
-            await self.async_set_unique_id(unique_id)
-            self._abort_if_unique_id_configured()
+            user_input[CONF_SLAVE] = int(user_input[CONF_SLAVE])
+            user_input["baudrate"] = int(user_input["baudrate"])
+            await self._async_set_inverter_unique_id(user_input[CONF_PORT], user_input[CONF_SLAVE])
 
             return self.async_create_entry(
-                title=f"Luxpower Inverter (Slave {user_input[CONF_SLAVE]})",
+                title=_entry_title(user_input),
                 data=user_input,
             )
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_discovery(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Let the user pick the serial ports to probe."""
+        errors: dict[str, str] = {}
+        if user_input is not None and not user_input["ports"]:
+            errors["ports"] = "no_ports_selected"
+        elif user_input is not None:
+            self._ports = user_input["ports"]
+            return await self.async_step_discovery_devices()
+
+        ports = await async_list_ports(self.hass)
+        if not ports:
+            return self.async_abort(reason="no_ports_found")
+
+        # Radio sticks of other integrations are listed but not preselected, as
+        # probing sends Modbus frames at several baud rates
+        configured = {entry.data[CONF_PORT] for entry in self._async_current_entries()}
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    "ports",
+                    default=[port.device for port in ports if port.suggested or port.device in configured],
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[
+                            SelectOptionDict(
+                                value=port.device,
+                                label=f"{port.device} - {port.description}" if port.description else port.device,
+                            )
+                            for port in ports
+                        ],
+                        multiple=True,
+                    )
+                ),
+            }
+        )
+        return self.async_show_form(step_id="discovery", data_schema=schema, errors=errors)
+
+    async def async_step_discovery_devices(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Probe the selected serial ports and let the user pick the inverters found."""
+        errors: dict[str, str] = {}
+        if user_input is not None and not user_input["devices"]:
+            errors["devices"] = "no_devices_selected"
+        elif user_input is not None:
+            scan_interval = int(user_input[CONF_SCAN_INTERVAL])
+            selected = [self._discovered[key] for key in user_input["devices"]]
+            # One entry per inverter: the first is created here, the others are
+            # offered as discovered devices to confirm with a single click
+            for inverter in selected[1:]:
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+                        data=_entry_data(inverter, scan_interval),
+                    )
+                )
+            return await self.async_step_integration_discovery(_entry_data(selected[0], scan_interval))
+
+        if not self._discovered:
+            configured = {
+                (entry.data[CONF_PORT], int(entry.data[CONF_SLAVE]))
+                for entry in self._async_current_entries()
+            }
+            found = await async_discover_inverters(self.hass, self._ports, configured)
+            if not found:
+                return self.async_abort(reason="no_devices_found")
+            self._discovered = {f"{inverter.port}|{inverter.slave_id}": inverter for inverter in found}
+
+        schema = vol.Schema(
+            {
+                vol.Required("devices", default=list(self._discovered)): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[
+                            SelectOptionDict(
+                                value=key,
+                                label=f"{inverter.port} - Slave {inverter.slave_id} ({inverter.baudrate} baud)",
+                            )
+                            for key, inverter in self._discovered.items()
+                        ],
+                        multiple=True,
+                    )
+                ),
+                vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_POLL_INTERVAL): NumberSelector(
+                    NumberSelectorConfig(min=5, max=300, mode=NumberSelectorMode.BOX)
+                ),
+            }
         )
+        return self.async_show_form(step_id="discovery_devices", data_schema=schema, errors=errors)
+
+    async def async_step_integration_discovery(self, discovery_info: dict[str, Any]) -> FlowResult:
+        """Handle an inverter found by the discovery step."""
+        await self._async_set_inverter_unique_id(discovery_info[CONF_PORT], discovery_info[CONF_SLAVE])
+
+        self._discovery_data = discovery_info
+        self.context["title_placeholders"] = {
+            "slave_id": str(discovery_info[CONF_SLAVE]),
+            "port": discovery_info[CONF_PORT],
+        }
+        if self.source == config_entries.SOURCE_INTEGRATION_DISCOVERY:
+            return await self.async_step_discovery_confirm()
+        return self._async_create_discovered_entry()
+
+    async def async_step_discovery_confirm(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Confirm adding a discovered inverter."""
+        if user_input is not None:
+            return self._async_create_discovered_entry()
+
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders={
+                "slave_id": str(self._discovery_data[CONF_SLAVE]),
+                "port": self._discovery_data[CONF_PORT],
+                "baudrate": str(self._discovery_data["baudrate"]),
+            },
+        )
+
+    async def _async_set_inverter_unique_id(self, port: str, slave_id: int) -> None:
+        """Set the unique ID of an inverter, aborting if it is already configured.
+
+        Slave IDs are only unique per bus, so the port is part of the unique ID.
+        Entries created before that are matched on their data instead.
+        """
+        await self.async_set_unique_id(entry_unique_id(port, slave_id))
+        self._abort_if_unique_id_configured()
+        self._async_abort_entries_match({CONF_PORT: port, CONF_SLAVE: slave_id})
+
+    def _async_create_discovered_entry(self) -> FlowResult:
+        return self.async_create_entry(
+            title=_entry_title(self._discovery_data),
+            data=self._discovery_data,
+        )
+
+
+class LuxpowerModbusOptionsFlow(config_entries.OptionsFlow):
+    """Handle the options of a Luxpower Modbus RTU entry."""
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Select the optional register groups."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_REGISTER_GROUPS,
+                    default=self.config_entry.options.get(CONF_REGISTER_GROUPS, []),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=list(REGISTER_GROUP_TYPES),
+                        multiple=True,
+                        translation_key=CONF_REGISTER_GROUPS,
+                    )
+                ),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
+
+
+def _entry_title(data: dict[str, Any]) -> str:
+    """Return the title of an entry, naming the port as slave IDs repeat across buses."""
+    return f"Luxpower Inverter (Slave {data[CONF_SLAVE]} on {data[CONF_PORT]})"
+
+
+def _entry_data(inverter: DiscoveredInverter, scan_interval: int) -> dict[str, Any]:
+    """Return config entry data for a discovered inverter."""
+    return {
+        CONF_PORT: inverter.port,
+        CONF_SLAVE: inverter.slave_id,
+        "baudrate": inverter.baudrate,
+        CONF_SCAN_INTERVAL: scan_interval,
+    }
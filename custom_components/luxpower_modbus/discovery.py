@@ -0,0 +1,149 @@
+"""Serial discovery for the Luxpower Modbus RTU integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import logging
+from typing import NamedTuple
+
+from homeassistant.core import HomeAssistant
+from pymodbus.client import ModbusSerialClient
+from pymodbus.pdu import ExceptionResponse
+
+from .const import (
+    DATA_SCHEDULER,
+    DISCOVERY_BAUDRATES,
+    DISCOVERY_EXCLUDED_PORT_KEYWORDS,
+    DISCOVERY_PROBE_ADDRESS,
+    DISCOVERY_RESPONSE_LATENCY,
+    DISCOVERY_SLAVE_IDS,
+    DISCOVERY_SWEEP_SLAVE_IDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Request and response of a single-register read: 8 + 7 characters of 10 bits (8N1)
+_PROBE_FRAME_BITS = (8 + 7) * 10
+
+
+class DiscoveredInverter(NamedTuple):
+    """An inverter that answered a probe."""
+
+    port: str
+    baudrate: int
+    slave_id: int
+
+
+class SerialPort(NamedTuple):
+    """A local serial port that can be scanned."""
+
+    device: str
+    description: str
+    suggested: bool  # Looks like a USB serial adapter rather than a radio stick
+
+
+def probe_timeout(baudrate: int) -> float:
+    """Return the time to wait for a probe response at a baud rate."""
+    return DISCOVERY_RESPONSE_LATENCY + _PROBE_FRAME_BITS / baudrate
+
+
+def _list_ports() -> list[SerialPort]:
+    """Return the local serial ports."""
+    from serial.tools import list_ports  # pyserial, installed with pymodbus serial support
+
+    ports = []
+    for port in list_ports.comports():
+        description = " ".join(filter(None, (port.manufacturer, port.product or port.description)))
+        suggested = port.vid is not None and not any(
+            keyword in description.lower() for keyword in DISCOVERY_EXCLUDED_PORT_KEYWORDS
+        )
+        ports.append(SerialPort(port.device, description, suggested))
+    return sorted(ports)
+
+
+async def async_list_ports(hass: HomeAssistant) -> list[SerialPort]:
+    """Return the local serial ports, without blocking the event loop."""
+    return await hass.async_add_executor_job(_list_ports)
+
+
+def _probe(client: ModbusSerialClient, slave_id: int) -> bool:
+    """Return True if a device answers a single-register read, even with an exception."""
+    try:
+        result = client.read_input_registers(DISCOVERY_PROBE_ADDRESS, 1, slave=slave_id)
+    except Exception:  # noqa: BLE001
+        return False
+    return not result.isError() or isinstance(result, ExceptionResponse)
+
+
+def _scan_port(port: str, baudrates: Iterable[int], skip_slave_ids: set[int]) -> list[DiscoveredInverter]:
+    """Find the baud rate and slave IDs answering on one port.
+
+    The sweep slave IDs (1, the factory default) are tried at every baud rate.
+    Once a baud rate gets an answer the rest of the port is scanned at that rate
+    only, since all devices on one bus share it; if none did, the remaining
+    slave IDs are only tried at the default rate, bounding the probes per port.
+    """
+    slave_ids = [s for s in DISCOVERY_SLAVE_IDS if s not in skip_slave_ids]
+    found: list[DiscoveredInverter] = []
+    clients: dict[int, ModbusSerialClient] = {}
+
+    def client_for(baudrate: int) -> ModbusSerialClient | None:
+        if baudrate not in clients:
+            clients[baudrate] = ModbusSerialClient(
+                port=port,
+                baudrate=baudrate,
+                stopbits=1,
+                bytesize=8,
+                parity="N",
+                timeout=probe_timeout(baudrate),
+                retries=0,
+            )
+        client = clients[baudrate]
+        return client if client.connect() else None
+
+    try:
+        candidates = list(baudrates)
+        for slave_id in slave_ids:
+            if slave_id not in DISCOVERY_SWEEP_SLAVE_IDS:
+                candidates = candidates[:1]
+            for baudrate in candidates:
+                if (client := client_for(baudrate)) is None:
+                    return found  # Port cannot be opened
+                try:
+                    if _probe(client, slave_id):
+                        found.append(DiscoveredInverter(port, baudrate, slave_id))
+                        candidates = [baudrate]
+                        break
+                finally:
+                    client.close()
+    finally:
+        for client in clients.values():
+            client.close()
+    return found
+
+
+async def async_discover_inverters(
+    hass: HomeAssistant, ports: list[str], configured: set[tuple[str, int]]
+) -> list[DiscoveredInverter]:
+    """Probe the given serial ports concurrently, skipping configured (port, slave ID) pairs."""
+    scheduler = hass.data.get(DATA_SCHEDULER)
+
+    async def scan(port: str) -> list[DiscoveredInverter]:
+        skip = {slave_id for p, slave_id in configured if p == port}
+        if scheduler:
+            await scheduler.async_wait_bus_closed(port)
+        if scheduler and (bus := scheduler.buses.get(port)):
+            # The port is in use by the integration: its baud rate is known and
+            # probes must not collide with the regular poll
+            async with bus.lock:
+                return await hass.async_add_executor_job(_scan_port, port, [bus.baudrate], skip)
+        return await hass.async_add_executor_job(_scan_port, port, DISCOVERY_BAUDRATES, skip)
+
+    results = await asyncio.gather(*(scan(port) for port in ports), return_exceptions=True)
+    found: list[DiscoveredInverter] = []
+    for port, result in zip(ports, results):
+        if isinstance(result, BaseException):
+            _LOGGER.debug("Scanning %s failed: %s", port, result)
+            continue
+        found.extend(result)
+    return found
@@ -8,8 +8,9 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, HOLDING_REGISTERS_NUMBERS
-from . import LuxpowerModbusDataCoordinator
+from .const import DOMAIN
+from . import LuxpowerModbusDataCoordinator, entry_device_key
+from .register_groups import number_descriptions
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +23,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = [
         LuxpowerModbusNumber(coordinator, entry, description)
-        for description in HOLDING_REGISTERS_NUMBERS
+        for description in number_descriptions()
     ]
     async_add_entities(entities)
 
@@ -34,19 +35,20 @@ class LuxpowerModbusNumber(CoordinatorEntity[LuxpowerModbusDataCoordinator], Num
         """Initialize the number."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{DOMAIN}_{config_entry.data['slave_id']}_{description.key}"
+        device_key = entry_device_key(config_entry)
+        self._attr_unique_id = f"{DOMAIN}_{device_key}_{description.key}"
 
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.data['slave_id'])},
-            name=f"Luxpower Inverter (Slave {config_entry.data['slave_id']})",
+            identifiers={(DOMAIN, device_key)},
+            name=f"Luxpower Inverter (Slave {coordinator.slave_id})",
             manufacturer="Luxpower",
         )
 
     @property
     def native_value(self) -> float | None:
         """Return the state of the number."""
-        if self.coordinator.data and self.entity_description.key in self.coordinator.data:
-            return self.coordinator.data[self.entity_description.key]
+        if self.coordinator.data:
+            return self.coordinator.data.value(self.entity_description.key)
         return None
 
     async def async_set_native_value(self, value: float) -> None:
@@ -69,5 +71,7 @@ class LuxpowerModbusNumber(CoordinatorEntity[LuxpowerModbusDataCoordinator], Num
                 if client.is_socket_open():
                     client.close()
 
-        if await self.hass.async_add_executor_job(write_value):
+        async with self.coordinator.lock:
+            written = await self.hass.async_add_executor_job(write_value)
+        if written:
             await self.coordinator.async_request_refresh()
@@ -0,0 +1,115 @@
+"""Parallel system aggregation for the Luxpower Modbus RTU integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import logging
+from typing import TYPE_CHECKING, NamedTuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import LuxpowerModbusDataCoordinator
+    from .registers import LuxpowerModbusRegisters
+
+_LOGGER = logging.getLogger(__name__)
+
+ROLE_MASTER = 1
+ROLE_SLAVE = 2
+
+
+class ParallelState(NamedTuple):
+    """Decoded input register 113 (Master/Slave)."""
+
+    role: int
+    phase: int
+    order: int
+    count: int
+
+
+def decode_parallel_state(raw: int) -> ParallelState:
+    """Decode the Master/Slave bitmap in input register 113."""
+    return ParallelState(
+        role=raw & 0x03,
+        phase=(raw >> 2) & 0x03,
+        order=(raw >> 4) & 0x03,
+        count=(raw >> 8) & 0xFF,
+    )
+
+
+def parallel_state(coordinator: LuxpowerModbusDataCoordinator) -> ParallelState | None:
+    """Return the parallel state last polled by a coordinator, if any."""
+    if not coordinator.data or (raw := coordinator.data.value("master_slave_state")) is None:
+        return None
+    return decode_parallel_state(int(raw))
+
+
+def _sum(members: list[LuxpowerModbusRegisters], *keys: str) -> float:
+    return sum(data.value(key) or 0.0 for data in members for key in keys)
+
+
+def _combined_soc(members: list[LuxpowerModbusRegisters]) -> float | None:
+    """Battery SOC across the stack, weighted by BMS capacity where reported."""
+    socs = [
+        (soc, data.value("bms_capacity") or 0.0)
+        for data in members
+        if (soc := data.value("battery_soc")) is not None
+    ]
+    if not socs:
+        return None
+    total_capacity = sum(capacity for _, capacity in socs)
+    if total_capacity > 0:
+        return round(sum(soc * capacity for soc, capacity in socs) / total_capacity, 1)
+    return round(sum(soc for soc, _ in socs) / len(socs), 1)
+
+
+class LuxpowerModbusParallelSystem(DataUpdateCoordinator):
+    """Aggregate values of one parallel stack, computed from the members' last poll.
+
+    The stack is anchored on its master inverter. Slaves are matched on the parallel
+    count they report, so a site is assumed to run one stack per stack size. No
+    registers are read here; the poll scheduler pushes one update per cycle.
+    """
+
+    def __init__(self, hass: HomeAssistant, master: LuxpowerModbusDataCoordinator) -> None:
+        """Initialize."""
+        self.master = master
+        self.member_slave_ids: list[int] = []
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_parallel_{master.slave_id}",
+            update_interval=None,
+        )
+
+    @callback
+    def async_update_from_members(self, coordinators: Iterable[LuxpowerModbusDataCoordinator]) -> None:
+        """Recompute the aggregates from the coordinators' current data."""
+        master_state = parallel_state(self.master)
+        if master_state is None or master_state.role != ROLE_MASTER:
+            return
+
+        members = [self.master]
+        for coordinator in coordinators:
+            if coordinator is self.master or not coordinator.last_update_success:
+                continue
+            state = parallel_state(coordinator)
+            if state and state.role == ROLE_SLAVE and state.count == master_state.count:
+                members.append(coordinator)
+
+        self.member_slave_ids = [member.slave_id for member in members]
+        data = [member.data for member in members]
+        self.async_set_updated_data(
+            {
+                "parallel_total_pv_power": _sum(data, "total_pv_power"),
+                "parallel_total_load_power": _sum(data, "load_power"),
+                "parallel_net_grid_power": _sum(data, "power_from_grid_r", "power_from_grid_s", "power_from_grid_t")
+                - _sum(data, "power_to_grid_r", "power_to_grid_s", "power_to_grid_t"),
+                "parallel_net_battery_power": _sum(data, "battery_charge_power") - _sum(data, "battery_discharge_power"),
+                "parallel_combined_soc": _combined_soc(data),
+                "parallel_inverter_count": len(members),
+            }
+        )
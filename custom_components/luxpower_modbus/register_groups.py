@@ -0,0 +1,204 @@
+"""Entity descriptions built on demand from the generated register map."""
+from __future__ import annotations
+
+from functools import cache
+from typing import Callable
+
+from homeassistant.components.number import NumberDeviceClass, NumberMode
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import EntityCategory
+
+from .const import (
+    HOLDING_NUMBER_ENTITIES,
+    HOLDING_SELECT_ENTITIES,
+    HOLDING_SWITCH_ENTITIES,
+    INPUT_BYTE_SENSOR_ENTITIES,
+    INPUT_SENSOR_ENTITIES,
+    REGISTER_GROUP_HOLDING,
+    REGISTER_GROUP_INPUT,
+    LuxpowerModbus32bitSensorEntityDescription,
+    LuxpowerModbusNumberEntityDescription,
+    LuxpowerModbusSelectEntityDescription,
+    LuxpowerModbusSensorEntityDescription,
+    LuxpowerModbusSwitchEntityDescription,
+    signed_int,
+)
+from .registers import register_width
+
+UNIT_DEVICE_CLASSES = {
+    "V": SensorDeviceClass.VOLTAGE,
+    "A": SensorDeviceClass.CURRENT,
+    "mA": SensorDeviceClass.CURRENT,
+    "W": SensorDeviceClass.POWER,
+    "kW": SensorDeviceClass.POWER,
+    "kWh": SensorDeviceClass.ENERGY,
+    "Hz": SensorDeviceClass.FREQUENCY,
+    "°C": SensorDeviceClass.TEMPERATURE,
+    "VA": SensorDeviceClass.APPARENT_POWER,
+    "var": SensorDeviceClass.REACTIVE_POWER,
+    "ms": SensorDeviceClass.DURATION,
+    "s": SensorDeviceClass.DURATION,
+    "min": SensorDeviceClass.DURATION,
+    "h": SensorDeviceClass.DURATION,
+    "d": SensorDeviceClass.DURATION,
+}
+
+
+@cache
+def _register_map(register_type: str) -> dict[int, tuple]:
+    """Return the generated register map rows of one register space by address."""
+    from . import register_map  # Only loaded once entities are set up
+
+    table = register_map.INPUT_REGISTER_MAP if register_type == "input" else register_map.HOLDING_REGISTER_MAP
+    return {row[0]: row for row in table}
+
+
+def _signed(scale: float) -> Callable[[int], float]:
+    return lambda val: signed_int(val) * scale
+
+
+def _byte(shift: int, scale: float) -> Callable[[int], float]:
+    return lambda val: (val >> shift & 0xFF) * scale
+
+
+def _sensor(
+    row: tuple,
+    key: str,
+    name: str,
+    device_class: SensorDeviceClass | None,
+    state_class: SensorStateClass | None,
+    **kwargs,
+) -> LuxpowerModbusSensorEntityDescription:
+    """Build a read-only sensor description for one register map row."""
+    address, width, scale, signed, unit, _, _, bitfields = row
+    cls = LuxpowerModbus32bitSensorEntityDescription if width == 2 else LuxpowerModbusSensorEntityDescription
+    kwargs.setdefault("value_fn", _signed(scale) if signed and width == 1 else None)
+    return cls(
+        key=key,
+        name=name,
+        register_address=address,
+        scale=scale,
+        bitfields=bitfields,
+        native_unit_of_measurement=unit or None,
+        device_class=device_class,
+        state_class=state_class,
+        **kwargs,
+    )
+
+
+def _curated_sensors() -> tuple[LuxpowerModbusSensorEntityDescription, ...]:
+    rows = _register_map("input")
+    return tuple(
+        _sensor(
+            rows[address],
+            key,
+            name,
+            SensorDeviceClass(device_class) if device_class else None,
+            SensorStateClass(state_class) if state_class else None,
+        )
+        for address, (key, name, device_class, state_class) in INPUT_SENSOR_ENTITIES.items()
+    ) + tuple(
+        _sensor(
+            rows[address],
+            key,
+            name,
+            SensorDeviceClass(device_class) if device_class else None,
+            SensorStateClass(state_class) if state_class else None,
+            value_fn=_byte(shift, rows[address][2]),
+        )
+        for (address, shift), (key, name, device_class, state_class) in INPUT_BYTE_SENSOR_ENTITIES.items()
+    )
+
+
+def _extended_sensors(register_type: str, curated: set[int]) -> tuple[LuxpowerModbusSensorEntityDescription, ...]:
+    descriptions = []
+    for row in _register_map(register_type).values():
+        address, width, _, _, unit, item, _, _ = row
+        if not curated.isdisjoint(range(address, address + width)):
+            continue
+        device_class = UNIT_DEVICE_CLASSES.get(unit)
+        if register_type == "holding":
+            state_class = None
+        elif device_class == SensorDeviceClass.ENERGY:
+            state_class = SensorStateClass.TOTAL_INCREASING
+        elif unit:
+            state_class = SensorStateClass.MEASUREMENT
+        else:
+            state_class = None
+        descriptions.append(
+            _sensor(
+                row,
+                f"{register_type}_{address}",
+                item,
+                device_class,
+                state_class,
+                entity_category=EntityCategory.DIAGNOSTIC,
+            )
+        )
+    return tuple(descriptions)
+
+
+@cache
+def sensor_descriptions(group: str | None = None) -> tuple[LuxpowerModbusSensorEntityDescription, ...]:
+    """Return the curated sensor descriptions, or those of an optional register group.
+
+    Descriptions are built, and the register map imported, on the first call.
+    """
+    if group is None:
+        return _curated_sensors()
+    if group == REGISTER_GROUP_INPUT:
+        curated = {
+            address
+            for d in sensor_descriptions()
+            for address in range(d.register_address, d.register_address + register_width(d))
+        }
+        return _extended_sensors("input", curated)
+    if group == REGISTER_GROUP_HOLDING:
+        curated = {*HOLDING_NUMBER_ENTITIES, *HOLDING_SELECT_ENTITIES, *(address for address, _ in HOLDING_SWITCH_ENTITIES)}
+        return _extended_sensors("holding", curated)
+    raise ValueError(f"Unknown register group: {group}")
+
+
+@cache
+def number_descriptions() -> tuple[LuxpowerModbusNumberEntityDescription, ...]:
+    """Return the number descriptions, built on the first call."""
+    rows = _register_map("holding")
+    return tuple(
+        LuxpowerModbusNumberEntityDescription(
+            key=key,
+            name=name,
+            register_address=address,
+            scale=rows[address][2],
+            native_unit_of_measurement=rows[address][4] or None,
+            device_class=NumberDeviceClass(device_class) if device_class else None,
+            mode=NumberMode(mode),
+            native_min_value=min_value,
+            native_max_value=max_value,
+            native_step=step,
+        )
+        for address, (key, name, device_class, mode, min_value, max_value, step) in HOLDING_NUMBER_ENTITIES.items()
+    )
+
+
+@cache
+def select_descriptions() -> tuple[LuxpowerModbusSelectEntityDescription, ...]:
+    """Return the select descriptions, built on the first call."""
+    return tuple(
+        LuxpowerModbusSelectEntityDescription(
+            key=key,
+            name=name,
+            register_address=address,
+            options=list(value_map.values()),
+            value_map=value_map,
+        )
+        for address, (key, name, value_map) in HOLDING_SELECT_ENTITIES.items()
+    )
+
+
+@cache
+def switch_descriptions() -> tuple[LuxpowerModbusSwitchEntityDescription, ...]:
+    """Return the switch descriptions, built on the first call."""
+    return tuple(
+        LuxpowerModbusSwitchEntityDescription(key=key, name=name, register_address=address, bit=bit)
+        for (address, bit), (key, name) in HOLDING_SWITCH_ENTITIES.items()
+    )
@@ -0,0 +1,435 @@
+"""Register map compiled from modbus_protocol_updated_on_2025.06.14.md.
+
+Generated by scripts/generate_register_map.py, do not edit by hand.
+Rows are (address, width, scale, signed, unit, item, description, bitfields),
+with bitfields as (first bit, last bit, name) tuples.
+"""
+
+INPUT_REGISTER_MAP = (
+    (0, 1, 1.0, False, '', 'State', 'See "Operational Mode" in Appendix', ()),
+    (1, 1, 0.1, False, 'V', 'Vpv1', 'PV1 voltage', ()),
+    (2, 1, 0.1, False, 'V', 'Vpv2', 'PV2 voltage', ()),
+    (3, 1, 0.1, False, 'V', 'Vpv3', 'PV3 voltage', ()),
+    (4, 1, 0.1, False, 'V', 'Vbat', 'Battery voltage', ()),
+    (5, 1, 1.0, False, '%', 'SOC / SOH', 'Battery capacity / State of Health', ()),
+    (6, 1, 1.0, False, '', 'Internal Fault', 'See "Fault Code" file', ()),
+    (7, 1, 1.0, False, 'W', 'Ppv1', 'PV1 power', ()),
+    (8, 1, 1.0, False, 'W', 'Ppv2', 'PV2 power', ()),
+    (9, 1, 1.0, False, 'W', 'Ppv3', 'Total PV power (PV1+PV2+PV3)', ()),
+    (10, 1, 1.0, False, 'W', 'Pcharge', 'Power flowing into battery', ()),
+    (11, 1, 1.0, False, 'W', 'Pdischarge', 'Power flowing out of battery', ()),
+    (12, 1, 0.1, False, 'V', 'VacR', 'R-phase utility grid voltage', ()),
+    (13, 1, 0.1, False, 'V', 'VacS', 'S-phase utility grid voltage', ()),
+    (14, 1, 0.1, False, 'V', 'VacT', 'T-phase utility grid voltage', ()),
+    (15, 1, 0.01, False, 'Hz', 'Fac', 'Utility grid frequency', ()),
+    (16, 1, 1.0, False, 'W', 'Pinv', 'On-grid inverter power (R phase)', ()),
+    (17, 1, 1.0, False, 'W', 'Prec', 'AC charging rectification power (R phase)', ()),
+    (18, 1, 0.01, False, 'A', 'IinvRMS', 'Inverter RMS current output (R phase)', ()),
+    (19, 1, 0.001, False, '', 'PF', 'Power factor. Range (0,1000] -> x/1000; (1000,2000) -> (1000-x)/1000', ()),
+    (20, 1, 0.1, False, 'V', 'VepsR', 'R phase off-grid output voltage', ()),
+    (21, 1, 0.1, False, 'V', 'VepsS', 'S phase off-grid output voltage', ()),
+    (22, 1, 0.1, False, 'V', 'VepsT', 'T phase off-grid output voltage', ()),
+    (23, 1, 0.01, False, 'Hz', 'Feps', 'Off-grid output frequency', ()),
+    (24, 1, 1.0, False, 'W', 'Peps', 'Off-grid inverter power (R phase)', ()),
+    (25, 1, 1.0, False, 'VA', 'Seps', 'Off-grid apparent power (R phase)', ()),
+    (26, 1, 1.0, False, 'W', 'Ptogrid', 'User on-grid power (R phase)', ()),
+    (27, 1, 1.0, False, 'W', 'Ptouser', 'Grid power capacity (R phase)', ()),
+    (28, 1, 0.1, False, 'kWh', 'Epv1_day', 'PV1 power generation today', ()),
+    (29, 1, 0.1, False, 'kWh', 'Epv2_day', 'PV2 power generation today', ()),
+    (30, 1, 0.1, False, 'kWh', 'Epv3_day', 'Total PV generation today (PV1+2+3)', ()),
+    (31, 1, 0.1, False, 'kWh', 'Einv_day', "Today's on-grid inverter output energy", ()),
+    (32, 1, 0.1, False, 'kWh', 'Erec_day', "Today's AC charging rectifier energy", ()),
+    (33, 1, 0.1, False, 'kWh', 'Echg_day', 'Energy Charge today', ()),
+    (34, 1, 0.1, False, 'kWh', 'Edischg_day', 'Energy Discharge today', ()),
+    (35, 1, 0.1, False, 'kWh', 'Eeps_day', "Today's off-grid output energy", ()),
+    (36, 1, 0.1, False, 'kWh', 'Etogrid_day', "Today's export to grid energy", ()),
+    (37, 1, 0.1, False, 'kWh', 'Etouser_day', 'Electricity supplied to user from grid today', ()),
+    (38, 1, 0.1, False, 'V', 'Vbus1', 'Voltage of Bus 1', ()),
+    (39, 1, 0.1, False, 'V', 'Vbus2', 'Voltage of Bus 2', ()),
+    (40, 2, 0.1, False, 'kWh', 'Epv1_all', 'PV1 cumulative power', ()),
+    (42, 2, 0.1, False, 'kWh', 'Epv2_all', 'PV2 cumulative power', ()),
+    (44, 2, 0.1, False, 'kWh', 'Epv3_all', 'Total PV cumulative power', ()),
+    (46, 2, 0.1, False, 'kWh', 'Einv_all', 'Inverter output accumulated power', ()),
+    (48, 2, 0.1, False, 'kWh', 'Erec_all', 'AC charging accumulated power', ()),
+    (50, 2, 0.1, False, 'kWh', 'Echg_all', 'Cumulative charge energy', ()),
+    (52, 2, 0.1, False, 'kWh', 'Edischg_all', 'Cumulative discharge energy', ()),
+    (54, 2, 0.1, False, 'kWh', 'Eeps_all', 'Cumulative off-grid output energy', ()),
+    (56, 2, 0.1, False, 'kWh', 'Etogrid_all', 'Accumulate export energy', ()),
+    (58, 2, 0.1, False, 'kWh', 'Etouser_all', 'Cumulative import energy', ()),
+    (60, 2, 1.0, False, '', 'FaultCode', 'Fault code', ()),
+    (62, 2, 1.0, False, '', 'WarningCode', 'Warning code', ()),
+    (64, 1, 1.0, False, '°C', 'Tinner', 'Internal temperature', ()),
+    (65, 1, 1.0, False, '°C', 'Tradiator1', 'Radiator temperature 1', ()),
+    (66, 1, 1.0, False, '°C', 'Tradiator2', 'Radiator temperature 2', ()),
+    (67, 1, 1.0, False, '°C', 'Tbat', 'Battery temperature', ()),
+    (69, 2, 1.0, False, 's', 'RunningTime', 'Runtime duration', ()),
+    (71, 1, 1.0, False, '', 'AutoTestStatus', 'Bit0-3: Start (0:Not, 1:Start); Bit4-7: Status (0:Wait, 1:Test, 2:Fail, 3:V OK, 4:F OK, 5:Pass); Bit8-11: Step', ((0, 3, 'start'), (4, 7, 'status'), (8, 11, 'step'))),
+    (72, 1, 1.0, False, '', 'wAutoTestLimit', 'Voltage limit (Step 1,2,5,6) or Freq limit (Step 3,4,7,8)', ()),
+    (73, 1, 1.0, False, 'ms', 'uwAutoTestDefTime', 'Default Time', ()),
+    (74, 1, 1.0, False, '', 'uwAutoTestTripVal', 'Trip Value', ()),
+    (75, 1, 1.0, False, 'ms', 'uwAutoTestTripTime', 'Trip Time', ()),
+    (77, 1, 1.0, False, '', 'ACInputType', 'Bit0: 0-Grid, 1-Gen(12K); Bit1: AC Couple Inv Flow (0-No, 1-Show); Bit2: AC Couple En; Bit3: SmartLoadFlow (0-No, 1-Show); Bit4: SmartLoadEnOn (1:Enable); Bit5: EPSLoadPowerShow; Bit6: GridLoadPowerShow; Bit7: PloadPowerShow', ((0, 0, 'bit0'), (1, 1, 'ac_couple_inv_flow'), (2, 2, 'ac_couple_en'), (3, 3, 'smartloadflow'), (4, 4, 'smartloadenon'), (5, 5, 'epsloadpowershow'), (6, 6, 'gridloadpowershow'), (7, 7, 'ploadpowershow'))),
+    (80, 1, 1.0, False, '', 'BatType/Com', 'BatType (See file); BatComType (0-CAN, 1-485)', ()),
+    (81, 1, 0.01, False, 'A', 'MaxChgCurr', 'Max charge current (BMS limit)', ()),
+    (82, 1, 0.01, False, 'A', 'MaxDischgCurr', 'Max discharge current (BMS limit)', ()),
+    (83, 1, 0.1, False, 'V', 'ChargeVoltRef', 'Recommends charging voltage (BMS)', ()),
+    (84, 1, 0.1, False, 'V', 'DischgCutVolt', 'Recommends discharging cut-off voltage (BMS)', ()),
+    (85, 1, 1.0, False, '', 'BatStatus0', 'BMS Status Info 0', ()),
+    (86, 1, 1.0, False, '', 'BatStatus1', 'BMS Status Info 1', ()),
+    (87, 1, 1.0, False, '', 'BatStatus2', 'BMS Status Info 2', ()),
+    (88, 1, 1.0, False, '', 'BatStatus3', 'BMS Status Info 3', ()),
+    (89, 1, 1.0, False, '', 'BatStatus4', 'BMS Status Info 4', ()),
+    (90, 1, 1.0, False, '', 'BatStatus5', 'BMS Status Info 5', ()),
+    (91, 1, 1.0, False, '', 'BatStatus6', 'BMS Status Info 6', ()),
+    (92, 1, 1.0, False, '', 'BatStatus7', 'BMS Status Info 7', ()),
+    (93, 1, 1.0, False, '', 'BatStatus8', 'BMS Status Info 8', ()),
+    (94, 1, 1.0, False, '', 'BatStatus9', 'BMS Status Info 9', ()),
+    (95, 1, 1.0, False, '', 'BatStatus_INV', 'Inverter aggregated battery status', ()),
+    (96, 1, 1.0, False, '', 'BatParallelNum', 'Number of batteries in parallel', ()),
+    (97, 1, 1.0, False, 'Ah', 'BatCapacity', 'Battery capacity', ()),
+    (98, 1, 0.01, True, 'A', 'BatCurrent', 'Battery current (Signed)', ()),
+    (99, 1, 1.0, False, '', 'FaultCode_BMS', 'BMS Fault Code', ()),
+    (100, 1, 1.0, False, '', 'WarningCode_BMS', 'BMS Warning Code', ()),
+    (101, 1, 0.001, False, 'V', 'MaxCellVolt', 'Max cell voltage', ()),
+    (102, 1, 0.001, False, 'V', 'MinCellVolt', 'Min cell voltage', ()),
+    (103, 1, 0.1, True, '°C', 'MaxCellTemp', 'Max cell temp (Signed)', ()),
+    (104, 1, 0.1, True, '°C', 'MinCellTemp', 'Min cell temp (Signed)', ()),
+    (105, 1, 1.0, False, '', 'BMS Update/Dry', 'Bit0-2: Update State; Bit3: RSVD; Bit4: GenDryContactState (0-Off, 1-On, 12K only)', ((0, 2, 'update_state'), (3, 3, 'rsvd'), (4, 4, 'gendrycontactstate'))),
+    (106, 1, 1.0, False, '', 'CycleCnt_BMS', 'Charge/Discharge cycles', ()),
+    (107, 1, 0.1, False, 'V', 'BatVoltSample', 'Inverter sampled battery voltage', ()),
+    (108, 1, 0.1, False, '°C', 'T1', 'BT temperature for 12k', ()),
+    (113, 1, 1.0, False, '', 'Master/Slave', 'Bit0-1: 1:Master, 2:Slave; Bit2-3: Phase (1:R, 2:S, 3:T); Bit4-5: Order; Bit8-16: Parallel Num', ((0, 1, 'bits0_1'), (2, 3, 'phase'), (4, 5, 'order'), (8, 15, 'parallel_num'))),
+    (114, 1, 1.0, False, 'W', 'OnGridLoadPwr', 'Load power of 12k inverter when NOT off-grid', ()),
+    (115, 1, 1.0, False, '', 'SN[0]-Year', "'0'-'9', 'A'-'Z'", ()),
+    (116, 1, 1.0, False, '', 'SN[1]-Week', 'SN[1]-Week', ()),
+    (117, 1, 1.0, False, '', 'SN[4]-Prod', 'Product Code', ()),
+    (118, 1, 1.0, False, '', 'SN[6]-Serial', 'Serial Number', ()),
+    (119, 1, 1.0, False, '', 'SN[8]-Serial', 'Serial Number', ()),
+    (120, 1, 0.1, False, 'V', 'VBusP', 'Half BUS voltage', ()),
+    (121, 1, 0.1, False, 'V', 'GenVolt', 'Generator voltage (R phase)', ()),
+    (122, 1, 0.01, False, 'Hz', 'GenFreq', 'Generator frequency', ()),
+    (123, 1, 1.0, False, 'W', 'GenPower', 'Generator Power (R phase)', ()),
+    (124, 1, 0.1, False, 'kWh', 'Egen_day', 'Generator energy today', ()),
+    (125, 2, 0.1, False, 'kWh', 'Egen_all', 'Total generator energy', ()),
+    (127, 1, 0.1, False, 'V', 'EPSVoltL1N', 'EPS L1N / Gen S phase Voltage', ()),
+    (128, 1, 0.1, False, 'V', 'EPSVoltL2N', 'EPS L2N / Gen T phase Voltage', ()),
+    (129, 1, 1.0, False, 'W', 'Peps_L1N', 'Active Power EPS L1N / Off-grid S Phase', ()),
+    (130, 1, 1.0, False, 'W', 'Peps_L2N', 'Active Power EPS L2N / Off-grid T Phase', ()),
+    (131, 1, 1.0, False, 'VA', 'Seps_L1N', 'Apparent Power EPS L1N / Off-grid S Phase', ()),
+    (132, 1, 1.0, False, 'VA', 'Seps_L2N', 'Apparent Power EPS L2N / Off-grid T Phase', ()),
+    (133, 1, 0.1, False, 'kWh', 'EepsL1N_day', 'Daily energy EPS L1N / Off-grid S Phase', ()),
+    (134, 1, 0.1, False, 'kWh', 'EepsL2N_day', 'Daily energy EPS L2N / Off-grid T Phase', ()),
+    (135, 2, 0.1, False, 'kWh', 'EepsL1N_all', 'Total energy EPS L1N', ()),
+    (137, 2, 0.1, False, 'kWh', 'EepsL2N_all', 'Total energy EPS L2N', ()),
+    (139, 1, 1.0, False, 'var', 'Qinv', 'Reactive power', ()),
+    (140, 1, 1.0, False, 'mA', 'AFCI_CurrCH1', 'AFCI Current CH1', ()),
+    (141, 1, 1.0, False, 'mA', 'AFCI_CurrCH2', 'AFCI Current CH2', ()),
+    (142, 1, 1.0, False, 'mA', 'AFCI_CurrCH3', 'AFCI Current CH3', ()),
+    (143, 1, 1.0, False, 'mA', 'AFCI_CurrCH4', 'AFCI Current CH4', ()),
+    (144, 1, 1.0, False, '', 'AFCIFlag', 'Bit0-3: ArcAlarm CH1-4 (0-Norm, 1-Alarm); Bit4-7: SelfTest CH1-4 (0-Norm, 1-Fail)', ((0, 3, 'arcalarm_ch1_4'), (4, 7, 'selftest_ch1_4'))),
+    (145, 1, 1.0, False, '', 'AFCI_ArcCH1', 'Real time arc CH1', ()),
+    (146, 1, 1.0, False, '', 'AFCI_ArcCH2', 'Real time arc CH2', ()),
+    (147, 1, 1.0, False, '', 'AFCI_ArcCH3', 'Real time arc CH3', ()),
+    (148, 1, 1.0, False, '', 'AFCI_ArcCH4', 'Real time arc CH4', ()),
+    (149, 1, 1.0, False, '', 'AFCI_MaxArcCH1', 'Max arc CH1', ()),
+    (150, 1, 1.0, False, '', 'AFCI_MaxArcCH2', 'Max arc CH2', ()),
+    (151, 1, 1.0, False, '', 'AFCI_MaxArcCH3', 'Max arc CH3', ()),
+    (152, 1, 1.0, False, '', 'AFCI_MaxArcCH4', 'Max arc CH4', ()),
+    (153, 1, 1.0, False, 'W', 'ACCouplePower', 'AC Coupled inverter power', ()),
+    (154, 1, 1.0, False, '', 'AutoTestTripVal[0]', 'AutoTestTripVal[0]', ()),
+    (161, 1, 1.0, False, '', 'AutoTestTripVal[7]', 'AutoTestTripVal[7]', ()),
+    (162, 1, 1.0, False, 'ms', 'AutoTestTripTime[0]', 'AutoTestTripTime[0]', ()),
+    (169, 1, 1.0, False, 'ms', 'AutoTestTripTime[7]', 'AutoTestTripTime[7]', ()),
+    (170, 1, 1.0, False, 'W', 'Pload', 'Load consumption (On-grid mode)', ()),
+    (171, 1, 0.1, False, 'kWh', 'Eload_day', 'Load energy today', ()),
+    (172, 2, 0.1, False, 'kWh', 'Eload_all', 'Load energy total', ()),
+    (174, 1, 1.0, False, '', 'SwitchState', 'Bit0-4: DIP Safety Switch; Bit8: EPS Sw; Bit9: Gen Dry Contact; Bit10: Gen Quick Start; Bit15: SwRegUsed', ((0, 4, 'dip_safety_switch'), (8, 8, 'eps_sw'), (9, 9, 'gen_dry_contact'), (10, 10, 'gen_quick_start'), (15, 15, 'swregused'))),
+    (175, 1, 1.0, False, 's', 'EPS Ovl Ctrl', 'Connect in xx S after triggering EPS overload', ()),
+    (176, 1, 1.0, False, '', 'ExceptionReason1', 'Bit0-3: PVGridOn Exit; Bit4-7: PVChgGridOn Exit; Bit8-11: BatGridOn Exit; Bit12-15: PVBatGridOn Exit', ((0, 3, 'pvgridon_exit'), (4, 7, 'pvchggridon_exit'), (8, 11, 'batgridon_exit'), (12, 15, 'pvbatgridon_exit'))),
+    (177, 1, 1.0, False, '', 'ExceptionReason2', 'Bit0-3: PVCharge Exit; Bit4-7: ACCharge Exit; Bit8-11: PVACCharge Exit; Bit12-15: EPS Exit', ((0, 3, 'pvcharge_exit'), (4, 7, 'accharge_exit'), (8, 11, 'pvaccharge_exit'), (12, 15, 'eps_exit'))),
+    (178, 1, 1.0, False, '', 'ChgDischgDisable', 'Bit0-7: Charge Exit Reason; Bit8-15: Discharge Exit Reason', ((0, 7, 'charge_exit_reason'), (8, 15, 'discharge_exit_reason'))),
+    (180, 1, 1.0, False, 'W', 'Pinv_S', 'On grid inverter power (S phase)', ()),
+    (181, 1, 1.0, False, 'W', 'Pinv_T', 'On grid inverter power (T phase)', ()),
+    (182, 1, 1.0, False, 'W', 'Prec_S', 'Charging rectification power (S phase)', ()),
+    (183, 1, 1.0, False, 'W', 'Prec_T', 'Charging rectification power (T phase)', ()),
+    (184, 1, 1.0, False, 'W', 'Ptogrid_S', 'User on-grid power (S phase)', ()),
+    (185, 1, 1.0, False, 'W', 'Ptogrid_T', 'User on-grid power (T phase)', ()),
+    (186, 1, 1.0, False, 'W', 'Ptouser_S', 'Grid supply power (S phase)', ()),
+    (187, 1, 1.0, False, 'W', 'Ptouser_T', 'Grid supply power (T phase)', ()),
+    (188, 1, 1.0, False, 'W', 'GenPower_S', 'Generator power (S phase)', ()),
+    (189, 1, 1.0, False, 'W', 'GenPower_T', 'Generator power (T phase)', ()),
+    (190, 1, 0.01, False, '', 'IinvRMS_S', 'Effective inverter current (S phase)', ()),
+    (191, 1, 0.01, False, '', 'IinvRMS_T', 'Effective inverter current (T phase)', ()),
+    (192, 1, 0.001, False, '', 'PF_S', 'Power factor S phase', ()),
+    (193, 1, 0.1, False, 'V', 'GridVoltL1N', 'US Model', ()),
+    (194, 1, 0.1, False, 'V', 'GridVoltL2N', 'US Model', ()),
+    (195, 1, 0.1, False, 'V', 'GenVoltL1N', 'US Model', ()),
+    (196, 1, 0.1, False, 'V', 'GenVoltL2N', 'US Model', ()),
+    (197, 1, 1.0, False, 'W', 'PinvL1N', 'US Model', ()),
+    (198, 1, 1.0, False, 'W', 'PinvL2N', 'US Model', ()),
+    (199, 1, 1.0, False, 'W', 'PrecL1N', 'US Model', ()),
+    (200, 1, 1.0, False, 'W', 'PrecL2N', 'US Model', ()),
+    (201, 1, 1.0, False, 'W', 'Ptogrid_L1N', 'US Model', ()),
+    (202, 1, 1.0, False, 'W', 'Ptogrid_L2N', 'US Model', ()),
+    (203, 1, 1.0, False, 'W', 'Ptouser_L1N', 'US Model', ()),
+    (204, 1, 1.0, False, 'W', 'Ptouser_L2N', 'US Model', ()),
+    (205, 1, 0.001, False, '', 'PF_T', 'Power factor T phase', ()),
+    (206, 1, 1.0, False, 'W', 'ACCouplePwr_S', 'AC Couple Inv Power S', ()),
+    (207, 1, 1.0, False, 'W', 'ACCouplePwr_T', 'AC Couple Inv Power T', ()),
+    (208, 1, 1.0, False, 'W', 'OnGridLoadPwrS', 'Trip6-20k S phase load', ()),
+    (209, 1, 1.0, False, 'W', 'OnGridLoadPwrT', 'Trip6-20k T phase load', ()),
+    (210, 1, 1.0, False, 's', 'RemainingSecs', 'Remaining seconds of one click charging', ()),
+    (214, 1, 1.0, False, '°C', 'uwNTCForINDC', 'Internal temperature', ()),
+    (215, 1, 1.0, False, '°C', 'uwNTCForDCDCL', 'Radiator temperature 1', ()),
+    (216, 1, 1.0, False, '°C', 'uwNTCForDCDCH', 'Radiator temperature 2', ()),
+    (217, 1, 0.1, False, 'V', 'Vpv4', 'PV4 Voltage', ()),
+    (218, 1, 0.1, False, 'V', 'Vpv5', 'PV5 Voltage', ()),
+    (219, 1, 0.1, False, 'V', 'Vpv6', 'PV6 Voltage', ()),
+    (220, 1, 1.0, False, 'W', 'Ppv4', 'PV4 Power', ()),
+    (221, 1, 1.0, False, 'W', 'Ppv5', 'PV5 Power', ()),
+    (222, 1, 1.0, False, 'W', 'Ppv6', 'PV6 Power', ()),
+    (223, 1, 0.1, False, 'kWh', 'Epv4_day', 'PV4 Energy Today', ()),
+    (224, 2, 0.1, False, 'kWh', 'Epv4_all', 'PV4 Total Energy', ()),
+    (226, 1, 0.1, False, 'kWh', 'Epv5_day', 'PV5 Energy Today', ()),
+    (227, 2, 0.1, False, 'kWh', 'Epv5_all', 'PV5 Total Energy', ()),
+    (229, 1, 0.1, False, 'kWh', 'Epv6_day', 'PV6 Energy Today', ()),
+    (230, 2, 0.1, False, 'kWh', 'Epv6_all', 'PV6 Total Energy', ()),
+    (232, 1, 1.0, False, 'W', 'SmartLoadPwr', 'Smart Load output power', ()),
+)
+
+HOLDING_REGISTER_MAP = (
+    (7, 1, 1.0, False, '', 'FWCode0/1', 'Model code / Derived model', ()),
+    (8, 1, 1.0, False, '', 'FWCode2/3', 'ODM code / Region code', ()),
+    (9, 1, 1.0, False, '', 'Slave/Com Ver', 'Redundant CPU / Communication CPU Ver', ()),
+    (10, 1, 1.0, False, '', 'Cntl/FW Ver', 'Control CPU / External Software Ver', ()),
+    (11, 1, 1.0, False, '', 'ResetSetting', 'Bit1: Restore Default; Bit7: Restart Inverter; Others: Retain', ((1, 1, 'restore_default'), (7, 7, 'restart_inverter'))),
+    (12, 1, 1.0, False, '', 'Time_Year/Month', 'Year (17-255), Month (1-12)', ()),
+    (13, 1, 1.0, False, '', 'Time_Day/Hour', 'Day (1-31), Hour (0-23)', ()),
+    (14, 1, 1.0, False, '', 'Time_Min/Sec', 'Minute (0-59), Second (0-59)', ()),
+    (15, 1, 1.0, False, '', 'Com Addr', 'Modbus Address', ()),
+    (16, 1, 1.0, False, '', 'Language', '0:English, 1:German', ()),
+    (19, 1, 1.0, False, '', 'DTC:Device Type', '0:Default, 3:XOLTA', ()),
+    (20, 1, 1.0, False, '', 'PVInputModel', '12KHybrid: 0-NoPV, 1-PV1, 2-PV2, 3-PV3, 4-PV1&2, 5-PV1&3, 6-PV2&3, 7-All. TriP 6-20k: 0-All Indep, 1-PV1&2Par, 2-PV1&3Par, 3-PV2&3Par, 4-All Par.', ()),
+    (21, 1, 1.0, False, '', 'FuncEn', 'Bit0: EPS En; Bit1: OVF Load Derate En; Bit2: DRMS En; Bit3: LVRT En; Bit4: AntiIsland En; Bit5: NeutralDetect En; Bit6: GridOnPowerSS En; Bit7: ACCharge En; Bit8: SWSeamlessly En; Bit9: Standby; Bit10: ForcedDischg En; Bit11: ForcedChg En; Bit12: ISO En; Bit13: GFCI En; Bit14: DCI En; Bit15: FeedInGrid En', ((0, 0, 'eps_en'), (1, 1, 'ovf_load_derate_en'), (2, 2, 'drms_en'), (3, 3, 'lvrt_en'), (4, 4, 'antiisland_en'), (5, 5, 'neutraldetect_en'), (6, 6, 'gridonpowerss_en'), (7, 7, 'accharge_en'), (8, 8, 'swseamlessly_en'), (9, 9, 'standby'), (10, 10, 'forceddischg_en'), (11, 11, 'forcedchg_en'), (12, 12, 'iso_en'), (13, 13, 'gfci_en'), (14, 14, 'dci_en'), (15, 15, 'feedingrid_en'))),
+    (22, 1, 0.1, False, 'V', 'StartPVVolt', 'PV start-up voltage', ()),
+    (23, 1, 1.0, False, 's', 'ConnectTime', 'Waiting time of on-grid', ()),
+    (24, 1, 1.0, False, 's', 'ReconnectTime', 'Waiting time of Reconnect on-gird', ()),
+    (25, 1, 0.1, False, 'V', 'GridVoltConnLow', 'Lower limit allowed on-grid', ()),
+    (26, 1, 0.1, False, 'V', 'GridVoltConnHigh', 'Upper limit allowed on-grid', ()),
+    (27, 1, 0.01, False, 'Hz', 'GridFreqConnLow', 'Lower limit frequency', ()),
+    (28, 1, 0.01, False, 'Hz', 'GridFreqConnHigh', 'Upper limit frequency', ()),
+    (29, 1, 0.1, False, 'V', 'GridVoltLimit1Low', 'Level 1 undervoltage protection', ()),
+    (30, 1, 0.1, False, 'V', 'GridVoltLimit1High', 'Level 1 overvoltage protection', ()),
+    (31, 1, 1.0, False, '', 'GridVoltLimit1LowTime', 'Level 1 undervoltage time', ()),
+    (32, 1, 1.0, False, '', 'GridVoltLimit1HighTime', 'Level 1 overvoltage time', ()),
+    (33, 1, 0.1, False, 'V', 'GridVoltLimit2Low', 'Level 2 undervoltage protection', ()),
+    (34, 1, 0.1, False, 'V', 'GridVoltLimit2High', 'Level 2 overvoltage protection', ()),
+    (35, 1, 1.0, False, '', 'GridVoltLimit2LowTime', 'Level 2 undervoltage time', ()),
+    (36, 1, 1.0, False, '', 'GridVoltLimit2HighTime', 'Level 2 overvoltage time', ()),
+    (37, 1, 0.1, False, 'V', 'GridVoltLimit3Low', 'Level 3 undervoltage protection', ()),
+    (38, 1, 0.1, False, 'V', 'GridVoltLimit3High', 'Level 3 overvoltage protection', ()),
+    (39, 1, 1.0, False, '', 'GridVoltLimit3LowTime', 'Level 3 undervoltage time', ()),
+    (40, 1, 1.0, False, '', 'GridVoltLimit3HighTime', 'Level 3 overvoltage time', ()),
+    (41, 1, 0.1, False, 'V', 'GridVoltMovAvgHigh', 'Sliding average overvoltage point', ()),
+    (42, 1, 0.01, False, 'Hz', 'GridFreqLimit1Low', 'Freq Level 1 underfrequency point', ()),
+    (43, 1, 0.01, False, 'Hz', 'GridFreqLimit1High', 'Freq Level 1 overfrequency point', ()),
+    (44, 1, 1.0, False, '', 'GridFreqLimit1LowTime', 'Freq Level 1 underfrequency time', ()),
+    (45, 1, 1.0, False, '', 'GridFreqLimit1HighTime', 'Freq Level 1 overfrequency time', ()),
+    (46, 1, 0.01, False, 'Hz', 'GridFreqLimit2Low', 'Freq Level 2 underfrequency point', ()),
+    (47, 1, 0.01, False, 'Hz', 'GridFreqLimit2High', 'Freq Level 2 overfrequency point', ()),
+    (48, 1, 1.0, False, '', 'GridFreqLimit2LowTime', 'Freq Level 2 underfrequency time', ()),
+    (49, 1, 1.0, False, '', 'GridFreqLimit2HighTime', 'Freq Level 2 overfrequency time', ()),
+    (50, 1, 0.01, False, 'Hz', 'GridFreqLimit3Low', 'Freq Level 3 underfrequency point', ()),
+    (51, 1, 0.01, False, 'Hz', 'GridFreqLimit3High', 'Freq Level 3 overfrequency point', ()),
+    (52, 1, 1.0, False, '', 'GridFreqLimit3LowTime', 'Freq Level 3 underfrequency time', ()),
+    (53, 1, 1.0, False, '', 'GridFreqLimit3HighTime', 'Freq Level 3 overfrequency time', ()),
+    (54, 1, 1.0, False, '%', 'MaxQPercentForQV', 'Max % reactive power for Q(V)', ()),
+    (55, 1, 0.1, False, 'V', 'V2L', 'Q(V) curve undervoltage 2', ()),
+    (56, 1, 0.1, False, 'V', 'V1L', 'Q(V) curve undervoltage 1', ()),
+    (57, 1, 0.1, False, 'V', 'V1H', 'Q(V) curve overvoltage 1', ()),
+    (58, 1, 0.1, False, 'V', 'V2H', 'Q(V) curve overvoltage 2', ()),
+    (59, 1, 1.0, False, '', 'ReactivePowerCMD', '0:Unit PF; 1:Fixed PF; 2:Default Q(P); 3:Custom PF; 4:Capacitive; 5:Inductive; 6:QV; 7:QV_Dynamic', ()),
+    (60, 1, 1.0, False, '%', 'ActivePower%CMD', 'Active power percentage', ()),
+    (61, 1, 1.0, False, '%', 'ReactivePower%CMD', 'Reactive power percentage', ()),
+    (62, 1, 0.001, False, '', 'PFCMD', '750-1000 (under), 1750-2000 (over)', ()),
+    (63, 1, 1.0, False, '‰/min', 'PowerSoftStart', 'Loading rate', ()),
+    (64, 1, 1.0, False, '%', 'ChargePower%CMD', 'Charging power percentage', ()),
+    (65, 1, 1.0, False, '%', 'DischgPower%CMD', 'Discharging power percentage', ()),
+    (66, 1, 1.0, False, '%', 'ACChgPowerCMD', 'AC charge percentage', ()),
+    (67, 1, 1.0, False, '%', 'ACChgSOCLimit', 'SOC limit for AC charging', ()),
+    (68, 1, 1.0, False, '', 'ACChgStartTime', 'Start Hour/Minute', ()),
+    (69, 1, 1.0, False, '', 'ACChgEndTime', 'End Hour/Minute', ()),
+    (70, 1, 1.0, False, '', 'ACChgStart1', 'Start Hour/Minute 1', ()),
+    (71, 1, 1.0, False, '', 'ACChgEnd1', 'End Hour/Minute 1', ()),
+    (72, 1, 1.0, False, '', 'ACChgStart2', 'Start Hour/Minute 2', ()),
+    (73, 1, 1.0, False, '', 'ACChgEnd2', 'End Hour/Minute 2', ()),
+    (74, 1, 1.0, False, '%', 'ChgFirstPowerCMD', 'Charge priority percentage', ()),
+    (75, 1, 1.0, False, '%', 'ChgFirstSOCLimit', 'Charge priority SOC limit', ()),
+    (76, 1, 1.0, False, '', 'ChgFirstStart', 'Start Hour/Minute', ()),
+    (77, 1, 1.0, False, '', 'ChgFirstEnd', 'End Hour/Minute', ()),
+    (78, 1, 1.0, False, '', 'ChgFirstStart1', 'Start Hour/Minute 1', ()),
+    (79, 1, 1.0, False, '', 'ChgFirstEnd1', 'End Hour/Minute 1', ()),
+    (80, 1, 1.0, False, '', 'ChgFirstStart2', 'Start Hour/Minute 2', ()),
+    (81, 1, 1.0, False, '', 'ChgFirstEnd2', 'End Hour/Minute 2', ()),
+    (82, 1, 1.0, False, '%', 'ForcedDischgPwr', 'Forced discharge percentage', ()),
+    (83, 1, 1.0, False, '%', 'ForcedDischgSOC', 'Forced discharge SOC limit', ()),
+    (84, 1, 1.0, False, '', 'ForcedDischgStart', 'Start Hour/Minute', ()),
+    (85, 1, 1.0, False, '', 'ForcedDischgEnd', 'End Hour/Minute', ()),
+    (86, 1, 1.0, False, '', 'ForcedDischgStart1', 'Start Hour/Minute 1', ()),
+    (87, 1, 1.0, False, '', 'ForcedDischgEnd1', 'End Hour/Minute 1', ()),
+    (88, 1, 1.0, False, '', 'ForcedDischgStart2', 'Start Hour/Minute 2', ()),
+    (89, 1, 1.0, False, '', 'ForcedDischgEnd2', 'End Hour/Minute 2', ()),
+    (90, 1, 1.0, False, 'V', 'EPSVoltageSet', '230, 240, 277, 208, 220', ()),
+    (91, 1, 1.0, False, 'Hz', 'EPSFreqSet', 'Off-grid frequency', ()),
+    (92, 1, 0.1, False, 'V', 'LockInGridVForPFCurve', 'cosphi(P) lock in voltage', ()),
+    (93, 1, 0.1, False, 'V', 'LockOutGridVForPFCurve', 'cosphi(P) lock out voltage', ()),
+    (94, 1, 1.0, False, '%', 'LockInPowerForQVCurve', 'Q(V) lock in power', ()),
+    (95, 1, 1.0, False, '%', 'LockOutPowerForQVCurve', 'Q(V) lock out power', ()),
+    (96, 1, 1.0, False, '', 'DelayTimeForQVCurve', 'Q(V) delay', ()),
+    (97, 1, 1.0, False, '', 'DelayTimeOverFDerate', 'Overfrequency load reduction delay', ()),
+    (99, 1, 0.1, False, 'V', 'ChargeVoltRef', 'Lead-acid charge voltage', ()),
+    (100, 1, 0.1, False, 'V', 'CutVoltForDischg', 'Lead-acid discharge cut-off', ()),
+    (101, 1, 1.0, False, 'A', 'ChargeRate', 'Charging current', ()),
+    (102, 1, 1.0, False, 'A', 'DischgRate', 'Discharging current', ()),
+    (103, 1, 1.0, False, '%', 'MaxBackFlow', 'Feed-in grid power setting', ()),
+    (105, 1, 1.0, False, '%', 'EOD', 'Cut SOC for discharging', ()),
+    (106, 1, 0.1, False, '°C', 'TempLowLimDischg', 'Lead-acid Temp Low Limit (Dischg)', ()),
+    (107, 1, 0.1, False, '°C', 'TempHighLimDischg', 'Lead-acid Temp High Limit (Dischg)', ()),
+    (108, 1, 0.1, False, '°C', 'TempLowLimChg', 'Lead-acid Temp Low Limit (Chg)', ()),
+    (109, 1, 0.1, False, '°C', 'TempHighLimChg', 'Lead-acid Temp High Limit (Chg)', ()),
+    (110, 1, 1.0, False, '', 'FunctionEn1', 'Bit0: AC Storage En; Bit1: FastZeroExport; Bit2: MicroGrid En; Bit3: BatShared; Bit4: ChgLastEn; Bit5-6: CTSampleRatio (12K: L2/H2 bits); Bit7: BuzzerEn (12K: DryContactor); Bit8-9: PVCTSampleType (ACS3600 vs 12K); Bit10: TakeLoadTogether; Bit11: OnGridWorkingMode; Bit12-13: PVCTSampleRatio (Ext); Bit14: GreenMode; Bit15: EcoMode', ((0, 0, 'ac_storage_en'), (1, 1, 'fastzeroexport'), (2, 2, 'microgrid_en'), (3, 3, 'batshared'), (4, 4, 'chglasten'), (5, 6, 'ctsampleratio'), (7, 7, 'buzzeren'), (8, 9, 'pvctsampletype'), (10, 10, 'takeloadtogether'), (11, 11, 'ongridworkingmode'), (12, 13, 'pvctsampleratio'), (14, 14, 'greenmode'), (15, 15, 'ecomode'))),
+    (112, 1, 1.0, False, '', 'SetSystemType', '0:NoPar, 1:SinglePar, 2:Secondary, 3:3-PhaseMaster, 4:2*208 Master', ()),
+    (113, 1, 1.0, False, '', 'SetComposedPhase', 'Write Only. 0:Clear; 1-3:Set R/S/T. Read: Bit0-7 Offgrid phase, Bit8-15 Ongrid phase.', ((0, 7, 'offgrid_phase'), (8, 15, 'ongrid_phase'))),
+    (114, 1, 1.0, False, '', 'ClearFunction', 'Parallel Alarm clear', ()),
+    (115, 1, 0.01, False, 'Hz', 'OVFDerateStart', 'Over-frequency load reduction start', ()),
+    (116, 1, 1.0, False, 'W', 'PtoUserStartDischg', 'Device starts discharging when Ptouser > Value', ()),
+    (117, 1, 1.0, False, 'W', 'PtoUserStartChg', 'Device starts charging when Ptouser < Value', ()),
+    (118, 1, 0.1, False, 'V', 'VbatStartDerating', 'Lead-acid curve decrease start', ()),
+    (119, 1, 1.0, True, 'W', 'wCT_PowerOffset', 'Signed CT Power compensation', ()),
+    (120, 1, 1.0, False, '', 'stSysEnable', 'Bit0: HalfHourACChg; Bit1-3: ACChargeType (0-Dis, 1-Time, 2-Volt, 3-SOC, 4-V&T, 5-SOC&T); Bit4-5: DischgCtrlType (0-Volt, 1-SOC, 2-Both); Bit6: OnGridEODType; Bit7: GenChargeType; Bit8: SeparateZeroExportEn', ((0, 0, 'halfhouracchg'), (1, 3, 'acchargetype'), (4, 5, 'dischgctrltype'), (6, 6, 'ongrideodtype'), (7, 7, 'genchargetype'), (8, 8, 'separatezeroexporten'))),
+    (124, 1, 0.01, False, 'Hz', 'OVFDerateEnd', 'Over-frequency load reduction end', ()),
+    (125, 1, 1.0, False, '%', 'SOCLowLimitEPS', 'SOC low limit for EPS discharge', ()),
+    (126, 1, 1.0, False, '', 'OptimalChgDischg0-1', 'Bits 0-1 (00:00-00:30) to Bits 14-15 (03:30-04:00). 0:Def, 1:ACChg, 2:PVChg, 3:Dischg', ((0, 1, 'bits0_1'), (14, 15, 'bits14_15'))),
+    (127, 1, 1.0, False, '', 'OptimalChgDischg2-3', '04:00 - 08:00', ()),
+    (128, 1, 1.0, False, '', 'OptimalChgDischg4-5', '08:00 - 12:00', ()),
+    (129, 1, 1.0, False, '', 'OptimalChgDischg6-7', '12:00 - 16:00', ()),
+    (130, 1, 1.0, False, '', 'OptimalChgDischg8-9', '16:00 - 20:00', ()),
+    (131, 1, 1.0, False, '', 'OptimalChgDischg10-11', '20:00 - 24:00', ()),
+    (132, 1, 0.1, False, 'V', 'BatCellVoltLow/High', 'Battery cell voltage limits', ()),
+    (133, 1, 1.0, False, '', 'BatCellSerial/Para', 'Number of cells in series/parallel', ()),
+    (134, 1, 0.01, False, 'Hz', 'UVFDerateStart', 'Underfrequency load reduction start', ()),
+    (135, 1, 0.01, False, 'Hz', 'UVFDerateEnd', 'Underfrequency load reduction end', ()),
+    (136, 1, 1.0, False, '%', 'OVFDerateRatio', 'Underfrequency load ramp rate', ()),
+    (137, 1, 1.0, False, 'W', 'SpecLoadCompensate', 'Compensation for specific load', ()),
+    (138, 1, 0.1, False, '%', 'ChargePower%CMD', 'Charging power percentage', ()),
+    (139, 1, 0.1, False, '%', 'DischgPower%CMD', 'Discharging power percentage', ()),
+    (140, 1, 0.1, False, '%', 'ACChgPowerCMD', 'AC Charge percentage', ()),
+    (141, 1, 0.1, False, '%', 'ChgFirstPowerCMD', 'Charging priority percentage', ()),
+    (142, 1, 0.1, False, '%', 'ForcedDischgPwr', 'Forced discharge percentage', ()),
+    (143, 1, 0.1, False, '%', 'ActivePower%CMD', 'Inverse active percentage', ()),
+    (144, 1, 0.1, False, 'V', 'FloatChargeVolt', 'Float charge voltage', ()),
+    (145, 1, 1.0, False, '', 'OutputPrioConfig', '0:BatFirst, 1:PVFirst, 2:ACFirst', ()),
+    (146, 1, 1.0, False, '', 'LineMode', '0:APL, 1:UPS, 2:GEN', ()),
+    (147, 1, 1.0, False, 'Ah', 'BatteryCapacity', 'Unmatched battery capacity', ()),
+    (148, 1, 0.1, False, 'V', 'BatteryNominalVolt', 'Unmatched battery voltage', ()),
+    (149, 1, 1.0, False, '', 'EqualizationVolt', 'EqualizationVolt', ()),
+    (150, 1, 1.0, False, 'd', 'EqualizationInterval', 'EqualizationInterval', ()),
+    (151, 1, 1.0, False, 'h', 'EqualizationTime', 'EqualizationTime', ()),
+    (152, 1, 1.0, False, '', 'ACFirstStart', 'Start Hour/Minute', ()),
+    (153, 1, 1.0, False, '', 'ACFirstEnd', 'End Hour/Minute', ()),
+    (154, 1, 1.0, False, '', 'ACFirstStart1', 'Start Hour/Minute 1', ()),
+    (155, 1, 1.0, False, '', 'ACFirstEnd1', 'End Hour/Minute 1', ()),
+    (156, 1, 1.0, False, '', 'ACFirstStart2', 'Start Hour/Minute 2', ()),
+    (157, 1, 1.0, False, '', 'ACFirstEnd2', 'End Hour/Minute 2', ()),
+    (158, 1, 0.1, False, 'V', 'ACChgStartVolt', 'Battery voltage to start AC charge', ()),
+    (159, 1, 0.1, False, 'V', 'ACChgEndVolt', 'Battery voltage to end AC charge', ()),
+    (160, 1, 1.0, False, '%', 'ACChgStartSOC', 'SOC to start AC charge', ()),
+    (162, 1, 0.1, False, 'V', 'BatLowVoltage', 'Alarm point (Valid based on DisChgCtrl)', ()),
+    (163, 1, 0.1, False, 'V', 'BatLowBackVolt', 'Recovery point', ()),
+    (164, 1, 1.0, False, '%', 'BatLowSOC', 'Alarm point SOC', ()),
+    (165, 1, 1.0, False, '%', 'BatLowBackSOC', 'Recovery point SOC', ()),
+    (166, 1, 0.1, False, 'V', 'BatLowToUtilityV', 'Transfer to grid voltage point', ()),
+    (167, 1, 1.0, False, '%', 'BatLowToUtilitySOC', 'Transfer to grid SOC point', ()),
+    (168, 1, 1.0, False, 'A', 'ACChargeBatCurr', 'Charge current from AC', ()),
+    (169, 1, 0.1, False, 'V', 'OngridEOD_Volt', 'On-grid end of discharge voltage', ()),
+    (171, 1, 0.1, False, 'V', 'SOCCurve_BatVolt1', 'Point 1 calibration', ()),
+    (172, 1, 0.1, False, 'V', 'SOCCurve_BatVolt2', 'Point 2 calibration', ()),
+    (173, 1, 1.0, False, '%', 'SOCCurve_SOC1', 'SOC Point 1', ()),
+    (174, 1, 1.0, False, '%', 'SOCCurve_SOC2', 'SOC Point 2', ()),
+    (175, 1, 1.0, False, 'mΩ', 'SOCCurve_InnerRes', 'Inner resistance', ()),
+    (176, 1, 1.0, False, 'W', 'MaxGridInputPower', 'Grid import limit', ()),
+    (177, 1, 1.0, False, 'W', 'GenRatePower', 'Generator rated power', ()),
+    (179, 1, 1.0, False, '', 'uFunctionEn2', 'Bit0: ACCTDir; Bit1: PVCTDir; Bit2: AFCIAlarmClr; Bit3: BatWakeup PV Sell First; Bit4: VoltWattEn; Bit5: TripTimeUnit; Bit6: ActPowerCMDEn; Bit7: GridPeakShav; Bit8: GenPeakShav; Bit9: BatChgCtrl (SOC/Volt); Bit10: BatDischgCtrl; Bit11: ACcoupling; Bit12: PVArcEn; Bit13: SmartLoadEn; Bit14: RSDDisable; Bit15: OnGridAlwaysOn', ((0, 0, 'acctdir'), (1, 1, 'pvctdir'), (2, 2, 'afcialarmclr'), (3, 3, 'batwakeup_pv_sell_first'), (4, 4, 'voltwatten'), (5, 5, 'triptimeunit'), (6, 6, 'actpowercmden'), (7, 7, 'gridpeakshav'), (8, 8, 'genpeakshav'), (9, 9, 'batchgctrl'), (10, 10, 'batdischgctrl'), (11, 11, 'accoupling'), (12, 12, 'pvarcen'), (13, 13, 'smartloaden'), (14, 14, 'rsddisable'), (15, 15, 'ongridalwayson'))),
+    (180, 1, 1.0, False, '', 'AFCIArcThreshold', 'AFCIArcThreshold', ()),
+    (181, 1, 0.1, False, 'V', 'VoltWatt_V1', 'Default 1.06Vn', ()),
+    (182, 1, 0.1, False, 'V', 'VoltWatt_V2', 'Default 1.1Vn', ()),
+    (183, 1, 1.0, False, 'ms', 'VoltWatt_Delay', 'Default 10000ms', ()),
+    (184, 1, 1.0, False, '%', 'VoltWatt_P2', 'VoltWatt_P2', ()),
+    (185, 1, 0.1, False, 'V', 'Vref_QV', 'Vref_QV', ()),
+    (186, 1, 1.0, False, 's', 'Vref_filtertime', 'Vref_filtertime', ()),
+    (187, 1, 1.0, False, '%', 'Q3_QV', 'Q3_QV', ()),
+    (188, 1, 1.0, False, '%', 'Q4_QV', 'Q4_QV', ()),
+    (189, 1, 1.0, False, '%', 'P1_QP', 'P1_QP', ()),
+    (190, 1, 1.0, False, '%', 'P2_QP', 'P2_QP', ()),
+    (191, 1, 1.0, False, '%', 'P3_QP', 'P3_QP', ()),
+    (192, 1, 1.0, False, '%', 'P4_QP', 'P4_QP', ()),
+    (193, 1, 1.0, False, '%', 'UVFIncreaseRatio', 'Underfrequency load ramp rate', ()),
+    (194, 1, 0.1, False, 'V', 'GenChgStartVolt', 'Gen charge start voltage', ()),
+    (195, 1, 0.1, False, 'V', 'GenChgEndVolt', 'Gen charge end voltage', ()),
+    (196, 1, 1.0, False, '%', 'GenChgStartSOC', 'Gen charge start SOC', ()),
+    (197, 1, 1.0, False, '%', 'GenChgEndSOC', 'Gen charge end SOC', ()),
+    (198, 1, 1.0, False, 'A', 'MaxGenChgBatCurr', 'Max charge current from Gen', ()),
+    (199, 1, 0.1, False, '°C', 'OverTempDerate', 'OverTempDerate', ()),
+    (201, 1, 0.1, False, 'V', 'ChgFirstEndVolt', 'Charge priority voltage limit', ()),
+    (202, 1, 0.1, False, 'V', 'ForceDichgEndVolt', 'Forced discharge voltage limit', ()),
+    (203, 1, 1.0, False, '', 'GridRegulation', 'Settings', ()),
+    (204, 1, 1.0, False, 'Ah', 'LeadCapacity', 'LeadCapacity', ()),
+    (205, 1, 1.0, False, '', 'GridType', '0:Split240/120, 1:3ph 208/120, 2:Single240, 3:Single230, 4:Split200/100. (See Doc for 3-Phase list)', ()),
+    (206, 1, 0.1, False, 'kW', 'GridPeakShavPower', 'GridPeakShavPower', ()),
+    (207, 1, 1.0, False, '%', 'GridPeakShavSOC', 'GridPeakShavSOC', ()),
+    (208, 1, 0.1, False, 'V', 'GridPeakShavVolt', 'GridPeakShavVolt', ()),
+    (209, 1, 1.0, False, '', 'PeakShavStart', 'Start Hour/Minute', ()),
+    (210, 1, 1.0, False, '', 'PeakShavEnd', 'End Hour/Minute', ()),
+    (211, 1, 1.0, False, '', 'PeakShavStart1', 'Start Hour/Minute 1', ()),
+    (212, 1, 1.0, False, '', 'PeakShavEnd1', 'End Hour/Minute 1', ()),
+    (213, 1, 0.1, False, 'V', 'SmartLoadOnVolt', 'SmartLoadOnVolt', ()),
+    (214, 1, 0.1, False, 'V', 'SmartLoadOffVolt', 'SmartLoadOffVolt', ()),
+    (215, 1, 1.0, False, '%', 'SmartLoadOnSOC', 'SmartLoadOnSOC', ()),
+    (216, 1, 1.0, False, '%', 'SmartLoadOffSOC', 'SmartLoadOffSOC', ()),
+    (217, 1, 0.1, False, 'kW', 'StartPVpower', 'StartPVpower', ()),
+    (218, 1, 1.0, False, '%', 'GridPeakShavSOC1', 'GridPeakShavSOC1', ()),
+    (219, 1, 0.1, False, 'V', 'GridPeakShavVolt1', 'GridPeakShavVolt1', ()),
+    (220, 1, 1.0, False, '%', 'ACCoupleStartSOC', 'ACCoupleStartSOC', ()),
+    (221, 1, 1.0, False, '%', 'ACCoupleEndSOC', 'ACCoupleEndSOC', ()),
+    (222, 1, 0.1, False, 'V', 'ACCoupleStartVolt', 'ACCoupleStartVolt', ()),
+    (223, 1, 0.1, False, 'V', 'ACCoupleEndVolt', 'ACCoupleEndVolt', ()),
+    (224, 1, 1.0, False, '', 'LCDVersion/Type/ODM', 'Bit0-7:Ver, Bit8:Type, Bit9-15:ODM', ((0, 7, 'ver'), (8, 8, 'type'), (9, 15, 'odm'))),
+    (225, 1, 1.0, False, '', 'LCDPassword', 'LCDPassword', ()),
+    (227, 1, 1.0, False, '%', 'BatStopChgSOC', 'Stop charging SOC', ()),
+    (228, 1, 0.1, False, 'V', 'BatStopChgVolt', 'Stop charging Volt', ()),
+    (230, 1, 1.0, False, '', 'unMeterCfg', 'Bit0-3: Num; Bit8: MeasureType; Bit9-10: InstallPhase', ((0, 3, 'num'), (8, 8, 'measuretype'), (9, 10, 'installphase'))),
+    (231, 1, 1.0, False, '', 'unResetRecord', 'Bit0: G100 Reset', ((0, 0, 'g100_reset'),)),
+    (232, 1, 0.1, False, 'kW', 'GridPeakShavPwr1', 'GridPeakShavPwr1', ()),
+    (233, 1, 1.0, False, '', 'uFunction4En', 'Bit0: QuickChgStart; Bit1: BattBackup; Bit2: Maintenance; Bit3: WorkingMode; Bit4-7: DryContactorMultiplex (1:RSD, 2:DarkStart, 3:SmartLoad, 4:NonCrit); Bit8-9: ubExCTPosition; Bit10: OverFreq_fstop', ((0, 0, 'quickchgstart'), (1, 1, 'battbackup'), (2, 2, 'maintenance'), (3, 3, 'workingmode'), (4, 7, 'drycontactormultiplex'), (8, 9, 'ubexctposition'), (10, 10, 'overfreq_fstop'))),
+    (234, 1, 1.0, False, 'min', 'QuickChgTime', 'QuickChgTime', ()),
+    (235, 1, 1.0, False, '', 'uwNoFullChgDay', 'Bit0-7: Counter; Bit8-15: Set', ((0, 7, 'counter'), (8, 15, 'set'))),
+    (236, 1, 0.01, False, 'C', 'FloatChgThreshold', 'FloatChgThreshold', ()),
+    (237, 1, 0.1, False, 'min', 'GenCoolDownTime', 'GenCoolDownTime', ()),
+    (241, 1, 1.0, False, '', 'PermitService', '0-disable, non0-enable', ()),
+    (242, 1, 0.1, False, 'V', 'uwNPEThreshold', 'Zero ground detection', ()),
+    (244, 1, 1.0, False, '', 'Bootloader_Ver', 'Bit0-7 Ver; Bit8-15 Flag', ((0, 7, 'ver'), (8, 15, 'flag'))),
+    (245, 1, 1.0, False, '', 'FlashSize', 'FlashSize', ()),
+    (248, 1, 1.0, False, 'A', 'WattNode_CtAmps1', 'CT1 Ratio', ()),
+    (249, 1, 1.0, False, 'A', 'WattNode_CtAmps2', 'CT2 Ratio', ()),
+    (250, 1, 1.0, False, 'A', 'WattNode_CtAmps3', 'CT3 Ratio', ()),
+    (251, 1, 1.0, False, '', 'WattNode_Dir', 'Bit0-2: Directions CT1/2/3; Bit3-5: UpdateFreq', ((0, 2, 'directions_ct1_2_3'), (3, 5, 'updatefreq'))),
+    (252, 1, 1.0, False, 'A', 'NEC120BusBarLimit', 'NEC120BusBarLimit', ()),
+    (253, 1, 1.0, False, '%', 'DeltaSOC', 'Hysteresis SOC', ()),
+    (254, 1, 0.1, False, 'V', 'DeltaVolt', 'Hysteresis Volt', ()),
+    (256, 1, 1.0, False, '', 'GenStart', 'Start Hour/Minute', ()),
+    (257, 1, 1.0, False, '', 'GenEnd', 'End Hour/Minute', ()),
+    (258, 1, 1.0, False, '', 'GenStart1', 'Start Hour/Minute 1', ()),
+    (259, 1, 1.0, False, '', 'GenEnd1', 'End Hour/Minute 1', ()),
+    (260, 1, 1.0, False, 'V', 'uwBusVoltHighSet', 'uwBusVoltHighSet', ()),
+    (261, 1, 1.0, False, '', 'bDisRecovThresh', 'Battery Discharge Recovery (SOC/Volt)', ()),
+)
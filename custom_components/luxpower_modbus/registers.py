@@ -0,0 +1,124 @@
+"""Register images for the Luxpower Modbus RTU integration."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from .const import RAW_MAX_REGISTER_COUNT, LuxpowerModbus32bitSensorEntityDescription
+
+
+def register_width(description: Any) -> int:
+    """Return the number of registers an entity description spans."""
+    return 2 if isinstance(description, LuxpowerModbus32bitSensorEntityDescription) else 1
+
+
+def register_span(
+    descriptions: Iterable[Any], max_count: int = RAW_MAX_REGISTER_COUNT
+) -> list[tuple[int, int]]:
+    """Return the (start, count) blocks covering all descriptions, each at most ``max_count`` long."""
+    addresses = sorted({
+        address
+        for d in descriptions
+        for address in range(d.register_address, d.register_address + register_width(d))
+    })
+    blocks: list[tuple[int, int]] = []
+    for address in addresses:
+        if blocks and address - blocks[-1][0] < max_count:
+            blocks[-1] = (blocks[-1][0], address - blocks[-1][0] + 1)
+        else:
+            blocks.append((address, 1))
+    return blocks
+
+
+def _span_end(blocks: list[tuple[int, int]]) -> int:
+    """Return the address just past the last block."""
+    return sum(blocks[-1]) if blocks else 0
+
+
+def decode_value(description: Any, raw_val: int) -> float:
+    """Decode a raw register value as described by an entity description."""
+    if getattr(description, "value_fn", None):
+        return description.value_fn(raw_val)
+    return float(raw_val) * getattr(description, "scale", 1.0)
+
+
+class RegisterBank:
+    """Preallocated image of one register space, updated in place from block reads.
+
+    Every word carries a version that is bumped whenever the word changes, so
+    decoded values can be cached until the words behind them change. A version
+    of 0 means the word has never been read.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize."""
+        self.words = array("H", [0]) * size
+        self.versions = array("L", [0]) * size
+
+    def update(self, start: int, registers: Sequence[int]) -> None:
+        """Copy a block read into the image."""
+        words = self.words
+        versions = self.versions
+        for address, word in enumerate(registers, start):
+            if words[address] != word or not versions[address]:
+                words[address] = word
+                versions[address] += 1
+
+    def word(self, address: int) -> int | None:
+        """Return a raw register, or None if it has not been read yet."""
+        if address >= len(self.words) or not self.versions[address]:
+            return None
+        return self.words[address]
+
+
+class LuxpowerModbusRegisters:
+    """Input and holding register images of one inverter, decoded lazily per entity."""
+
+    def __init__(self, input_descriptions: Sequence[Any], holding_descriptions: Sequence[Any]) -> None:
+        """Initialize."""
+        self.input = RegisterBank(_span_end(register_span(input_descriptions)))
+        self.holding = RegisterBank(_span_end(register_span(holding_descriptions)))
+        self._descriptions: dict[str, tuple[RegisterBank, Any]] = {
+            **{d.key: (self.input, d) for d in input_descriptions},
+            **{d.key: (self.holding, d) for d in holding_descriptions},
+        }
+        self._cache: dict[str, tuple[int, float]] = {}
+        self._by_address: dict[tuple[str, int], list[Any]] = {}
+        for register_type, descriptions in (("input", input_descriptions), ("holding", holding_descriptions)):
+            for d in descriptions:
+                self._by_address.setdefault((register_type, d.register_address), []).append(d)
+
+    def bank(self, register_type: str) -> RegisterBank:
+        """Return the image of the input or holding registers."""
+        return self.input if register_type == "input" else self.holding
+
+    def descriptions_at(self, register_type: str, address: int) -> list[Any]:
+        """Return the entity descriptions starting at a register address."""
+        return self._by_address.get((register_type, address), [])
+
+    def value(self, key: str) -> float | None:
+        """Return the decoded value of an entity description, or None if not read yet."""
+        if key not in self._descriptions:
+            return None
+        bank, desc = self._descriptions[key]
+        address = desc.register_address
+        versions = bank.versions
+        if not versions[address]:
+            return None
+
+        wide = isinstance(desc, LuxpowerModbus32bitSensorEntityDescription)
+        version = versions[address] + versions[address + 1] if wide else versions[address]
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        if wide:
+            # Inverter uses L/H word order
+            raw_val = bank.words[address + 1] << 16 | bank.words[address]
+        else:
+            raw_val = bank.words[address]
+
+        value = decode_value(desc, raw_val)
+        self._cache[key] = (version, value)
+        return value
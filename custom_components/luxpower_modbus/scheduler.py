@@ -0,0 +1,229 @@
+"""Poll scheduler for the Luxpower Modbus RTU integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import RAW_REQUEST_MAX_DELAY, RAW_REQUEST_MIN_INTERVAL
+from .transport import CaptureWriter, CapturingModbusClient, create_client, time_scale
+
+if TYPE_CHECKING:
+    from . import LuxpowerModbusDataCoordinator
+    from .parallel import LuxpowerModbusParallelSystem
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LuxpowerModbusBus:
+    """A physical RS-485 bus (serial port) shared by one or more inverters."""
+
+    def __init__(self, port: str, baudrate: int) -> None:
+        """Initialize."""
+        self.port = port
+        self.baudrate = baudrate
+        self.client = create_client(port, baudrate)
+        # Above 1 only for a capture replayed faster than real time
+        self.time_scale = time_scale(port)
+        self.capture: CaptureWriter | None = None
+        # Held for every transaction on the bus, so polls and writes never interleave.
+        self.lock = asyncio.Lock()
+        self.coordinators: list[LuxpowerModbusDataCoordinator] = []
+        self._next_raw_slot = 0.0
+        self._raw_pending = 0
+
+    def start_capture(self, path: str, max_bytes: int, backup_count: int) -> None:
+        """Write all traffic on this bus to a capture file."""
+        self.stop_capture()
+        self.capture = CaptureWriter(path, max_bytes, backup_count)
+        self.client = CapturingModbusClient(self.client, self.capture)
+
+    def close(self) -> None:
+        """Close the port and any capture file."""
+        self.client.close()
+        self.stop_capture()
+
+    def stop_capture(self) -> None:
+        """Stop capturing traffic on this bus."""
+        if self.capture is None:
+            return
+        self.client = self.client.client
+        self.capture.close()
+        self.capture = None
+
+    @asynccontextmanager
+    async def async_raw_request(self) -> AsyncIterator[Callable[[], None]]:
+        """Hold the bus lock for an on-demand raw request, spaced so it never starves the poll.
+
+        Yields a callable that books the rate limit slot. Call it only when the
+        request actually goes out on the bus, so answers from cache are free.
+        """
+        if self._raw_pending * RAW_REQUEST_MIN_INTERVAL > RAW_REQUEST_MAX_DELAY:
+            raise HomeAssistantError(f"Too many raw register requests queued on {self.port}")
+        self._raw_pending += 1
+        try:
+            while True:
+                if (delay := self._next_raw_slot - time.monotonic()) > 0:
+                    await asyncio.sleep(delay)
+                async with self.lock:
+                    # Another request may have taken the slot while this one waited for the lock
+                    if time.monotonic() >= self._next_raw_slot:
+                        yield self._book_raw_slot
+                        return
+        finally:
+            self._raw_pending -= 1
+
+    def _book_raw_slot(self) -> None:
+        """Start the minimum interval before the next raw request."""
+        self._next_raw_slot = time.monotonic() + RAW_REQUEST_MIN_INTERVAL
+
+    async def async_poll(self, interval: float) -> None:
+        """Refresh the coordinators polled at ``interval``, strictly one after another."""
+        for coordinator in list(self.coordinators):
+            # Coordinators unloaded earlier in this cycle must not reopen the port
+            if coordinator in self.coordinators and coordinator.poll_interval == interval:
+                await coordinator.async_refresh()
+
+
+class LuxpowerModbusPollScheduler:
+    """Run poll cycles for all buses, concurrently across buses and serially within one.
+
+    Cycles are started on wall-clock multiples of the polling interval, so inverters
+    sharing an interval are sampled at the same instant even when they sit on
+    different buses, and a cycle takes as long as the slowest bus.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.buses: dict[str, LuxpowerModbusBus] = {}
+        self.parallel_systems: list[LuxpowerModbusParallelSystem] = []
+        self._unsub_timers: dict[float, Callable[[], None]] = {}
+        self._cycles: dict[float, asyncio.Task] = {}
+        self._closing: dict[str, asyncio.Task] = {}
+
+    @callback
+    def async_get_bus(self, port: str, baudrate: int) -> LuxpowerModbusBus:
+        """Return the bus for a serial port, creating it if needed."""
+        if (bus := self.buses.get(port)) is None:
+            bus = self.buses[port] = LuxpowerModbusBus(port, baudrate)
+        elif bus.baudrate != baudrate:
+            _LOGGER.warning(
+                "Port %s is already open at %s baud, ignoring requested %s baud",
+                port,
+                bus.baudrate,
+                baudrate,
+            )
+        return bus
+
+    @callback
+    def async_add_coordinator(self, coordinator: LuxpowerModbusDataCoordinator) -> None:
+        """Start polling a coordinator on its bus."""
+        coordinator.bus.coordinators.append(coordinator)
+        if coordinator.poll_interval not in self._unsub_timers:
+            self._async_schedule(coordinator.poll_interval)
+
+    @callback
+    def async_remove_coordinator(self, coordinator: LuxpowerModbusDataCoordinator) -> None:
+        """Stop polling a coordinator, releasing its bus once nothing else uses it."""
+        self.parallel_systems = [
+            system for system in self.parallel_systems if system.master is not coordinator
+        ]
+        bus = coordinator.bus
+        if coordinator in bus.coordinators:
+            bus.coordinators.remove(coordinator)
+        if not bus.coordinators and self.buses.get(bus.port) is bus:
+            del self.buses[bus.port]
+            self._closing[bus.port] = self.hass.async_create_task(self._async_close_bus(bus))
+
+        interval = coordinator.poll_interval
+        if not any(c.poll_interval == interval for c in self.coordinators):
+            if unsub := self._unsub_timers.pop(interval, None):
+                unsub()
+
+    async def _async_close_bus(self, bus: LuxpowerModbusBus) -> None:
+        """Close a released bus once the cycles and any transaction in flight on it have finished.
+
+        Cycles are waited for rather than cancelled: cancelling one releases the bus
+        lock while its executor job is still using the port.
+        """
+        try:
+            if cycles := [task for task in self._cycles.values() if not task.done()]:
+                await asyncio.wait(cycles)
+            async with bus.lock:
+                await self.hass.async_add_executor_job(bus.close)
+        finally:
+            if self._closing.get(bus.port) is asyncio.current_task():
+                del self._closing[bus.port]
+
+    async def async_wait_bus_closed(self, port: str) -> None:
+        """Wait until a bus released on ``port`` is closed, so two buses never share a port."""
+        if task := self._closing.get(port):
+            await asyncio.wait([task])
+
+    @callback
+    def async_add_parallel_system(self, system: LuxpowerModbusParallelSystem) -> None:
+        """Update a parallel system at the end of each of its master's cycles."""
+        self.parallel_systems.append(system)
+        system.async_update_from_members(self.coordinators)
+
+    @property
+    def coordinators(self) -> list[LuxpowerModbusDataCoordinator]:
+        """Return the coordinators on all buses."""
+        return [c for bus in self.buses.values() for c in bus.coordinators]
+
+    @callback
+    def _async_schedule(self, interval: float, previous: float | None = None) -> None:
+        """Arm the timer for the next aligned cycle of ``interval``.
+
+        Ticks are armed from the ``previous`` target boundary rather than from the
+        time the timer fired, so a timer firing slightly early does not arm the
+        next tick for the boundary it was meant to hit.
+        """
+        now = time.time()
+        if previous is not None and previous + interval > now:
+            target = previous + interval
+        else:  # First tick, or boundaries were missed
+            target = (now // interval + 1) * interval
+
+        @callback
+        def _async_tick(_now: datetime) -> None:
+            self._async_schedule(interval, target)
+            if (task := self._cycles.get(interval)) and not task.done():
+                _LOGGER.warning(
+                    "Previous %ss poll cycle still running, skipping this one", interval
+                )
+                return
+            self._cycles[interval] = self.hass.async_create_task(
+                self._async_poll_cycle(interval)
+            )
+
+        self._unsub_timers[interval] = async_call_later(self.hass, target - now, _async_tick)
+
+    async def _async_poll_cycle(self, interval: float) -> None:
+        """Poll every bus concurrently, then update the parallel systems once."""
+        start = time.monotonic()
+        buses = list(self.buses.values())
+        results = await asyncio.gather(
+            *(bus.async_poll(interval) for bus in buses), return_exceptions=True
+        )
+        for bus, result in zip(buses, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Poll cycle (%ss) on %s failed", interval, bus.port, exc_info=result)
+        for system in self.parallel_systems:
+            if system.master.poll_interval == interval:
+                system.async_update_from_members(self.coordinators)
+        _LOGGER.debug(
+            "Poll cycle (%ss) over %d bus(es) took %.3fs",
+            interval,
+            len(buses),
+            time.monotonic() - start,
+        )
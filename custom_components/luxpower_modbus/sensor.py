@@ -6,8 +6,9 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, INPUT_REGISTERS_SENSORS, INPUT_REGISTERS_SENSORS_32BIT
-from . import LuxpowerModbusDataCoordinator
+from .const import DOMAIN, PARALLEL_SYSTEM_SENSORS
+from . import LuxpowerModbusDataCoordinator, entry_device_key
+from .parallel import LuxpowerModbusParallelSystem
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -17,12 +18,15 @@ async def async_setup_entry(
     """Set up sensor entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    all_sensors = list(INPUT_REGISTERS_SENSORS) + list(INPUT_REGISTERS_SENSORS_32BIT)
-
     entities = [
         LuxpowerModbusSensor(coordinator, entry, description)
-        for description in all_sensors
+        for description in coordinator.sensor_descriptions
     ]
+    if coordinator.parallel_system:
+        entities += [
+            LuxpowerModbusParallelSystemSensor(coordinator.parallel_system, entry, description)
+            for description in PARALLEL_SYSTEM_SENSORS
+        ]
     async_add_entities(entities)
 
 
@@ -33,11 +37,47 @@ class LuxpowerModbusSensor(CoordinatorEntity[LuxpowerModbusDataCoordinator], Sen
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{DOMAIN}_{config_entry.data['slave_id']}_{description.key}"
+        device_key = entry_device_key(config_entry)
+        self._attr_unique_id = f"{DOMAIN}_{device_key}_{description.key}"
 
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.data['slave_id'])},
-            name=f"Luxpower Inverter (Slave {config_entry.data['slave_id']})",
+            identifiers={(DOMAIN, device_key)},
+            name=f"Luxpower Inverter (Slave {coordinator.slave_id})",
+            manufacturer="Luxpower",
+        )
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        if self.coordinator.data:
+            return self.coordinator.data.value(self.entity_description.key)
+        return None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the bit fields of a bitmap register."""
+        if not self.entity_description.bitfields or (value := self.native_value) is None:
+            return None
+        raw = int(value)
+        return {
+            name: (raw >> first) & ((1 << (last - first + 1)) - 1)
+            for first, last, name in self.entity_description.bitfields
+        }
+
+
+class LuxpowerModbusParallelSystemSensor(CoordinatorEntity[LuxpowerModbusParallelSystem], SensorEntity):
+    """Luxpower Modbus parallel system aggregate sensor."""
+
+    def __init__(self, coordinator, config_entry, description):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        device_key = entry_device_key(config_entry)
+        self._attr_unique_id = f"{DOMAIN}_{device_key}_{description.key}"
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"parallel_{device_key}")},
+            name=f"Luxpower Parallel System (Master {coordinator.master.slave_id})",
             manufacturer="Luxpower",
         )
 
@@ -47,3 +87,8 @@ class LuxpowerModbusSensor(CoordinatorEntity[LuxpowerModbusDataCoordinator], Sen
         if self.coordinator.data and self.entity_description.key in self.coordinator.data:
             return self.coordinator.data[self.entity_description.key]
         return None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the slave IDs of the inverters in the stack."""
+        return {"member_slave_ids": self.coordinator.member_slave_ids}
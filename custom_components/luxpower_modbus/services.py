@@ -0,0 +1,186 @@
+"""Services for the Luxpower Modbus RTU integration."""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.const import CONF_PORT
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import slugify
+
+from .const import DATA_SCHEDULER, DOMAIN, RAW_MAX_REGISTER_COUNT
+from .registers import decode_value, register_width
+from .scheduler import LuxpowerModbusBus
+from .transport import DEFAULT_CAPTURE_BACKUP_COUNT, DEFAULT_CAPTURE_MAX_BYTES
+
+if TYPE_CHECKING:
+    from . import LuxpowerModbusDataCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+SERVICE_READ_REGISTERS = "read_registers"
+SERVICE_WRITE_REGISTER = "write_register"
+
+START_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_PORT): cv.string,
+        vol.Optional("path"): cv.string,
+        vol.Optional("max_bytes", default=DEFAULT_CAPTURE_MAX_BYTES): vol.All(
+            vol.Coerce(int), vol.Range(min=4096)
+        ),
+        vol.Optional("backup_count", default=DEFAULT_CAPTURE_BACKUP_COUNT): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+    }
+)
+STOP_CAPTURE_SCHEMA = vol.Schema({vol.Optional(CONF_PORT): cv.string})
+READ_REGISTERS_SCHEMA = vol.Schema(
+    {
+        vol.Required("slave_id"): vol.All(vol.Coerce(int), vol.Range(min=1, max=255)),
+        vol.Optional(CONF_PORT): cv.string,
+        vol.Required("register_type"): vol.In(["input", "holding"]),
+        vol.Required("address"): vol.All(vol.Coerce(int), vol.Range(min=0, max=0xFFFF)),
+        vol.Optional("count", default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=RAW_MAX_REGISTER_COUNT)
+        ),
+    }
+)
+WRITE_REGISTER_SCHEMA = vol.Schema(
+    {
+        vol.Required("slave_id"): vol.All(vol.Coerce(int), vol.Range(min=1, max=255)),
+        vol.Optional(CONF_PORT): cv.string,
+        vol.Required("address"): vol.All(vol.Coerce(int), vol.Range(min=0, max=0xFFFF)),
+        vol.Required("value"): vol.All(vol.Coerce(int), vol.Range(min=0, max=0xFFFF)),
+    }
+)
+
+
+def _get_buses(hass: HomeAssistant, call: ServiceCall) -> list[LuxpowerModbusBus]:
+    """Return the buses targeted by a service call, all of them if no port is given."""
+    scheduler = hass.data.get(DATA_SCHEDULER)
+    buses = list(scheduler.buses.values()) if scheduler else []
+    if CONF_PORT in call.data:
+        buses = [bus for bus in buses if bus.port == call.data[CONF_PORT]]
+        if not buses:
+            raise HomeAssistantError(f"No inverter is configured on port {call.data[CONF_PORT]}")
+    return buses
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> LuxpowerModbusDataCoordinator:
+    """Return the coordinator of the inverter targeted by a service call.
+
+    A slave ID used on several buses is ambiguous unless a port is given.
+    """
+    slave_id = call.data["slave_id"]
+    matches = [
+        coordinator
+        for bus in _get_buses(hass, call)
+        for coordinator in bus.coordinators
+        if coordinator.slave_id == slave_id
+    ]
+    if not matches:
+        raise HomeAssistantError(f"No inverter is configured with slave ID {slave_id}")
+    if len(matches) > 1:
+        ports = ", ".join(coordinator.bus.port for coordinator in matches)
+        raise HomeAssistantError(f"Slave ID {slave_id} is configured on several ports ({ports}), specify the port")
+    return matches[0]
+
+
+def _decode_registers(
+    coordinator: LuxpowerModbusDataCoordinator, register_type: str, address: int, words: list[int]
+) -> list[dict[str, Any]]:
+    """Decode raw words, including the values of any entities mapped onto them."""
+    registers = []
+    for offset, word in enumerate(words):
+        register: dict[str, Any] = {
+            "address": address + offset,
+            "raw": word,
+            "signed": word - 0x10000 if word & 0x8000 else word,
+            "hex": f"0x{word:04X}",
+        }
+        for desc in coordinator.registers.descriptions_at(register_type, address + offset):
+            if offset + register_width(desc) > len(words):
+                continue
+            raw_val = word if register_width(desc) == 1 else words[offset + 1] << 16 | word
+            register.setdefault("entities", {})[desc.key] = decode_value(desc, raw_val)
+        registers.append(register)
+    return registers
+
+
+async def _async_read_registers(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Read a range of registers through the inverter's own bus."""
+    coordinator = _get_coordinator(hass, call)
+    register_type = call.data["register_type"]
+    address = call.data["address"]
+    words, cached = await coordinator.async_read_raw(register_type, address, call.data["count"])
+    return {
+        "register_type": register_type,
+        "address": address,
+        "raw": words,
+        "registers": _decode_registers(coordinator, register_type, address, words),
+        "cached": cached,
+    }
+
+
+async def _async_write_register(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Write a holding register through the inverter's own bus."""
+    coordinator = _get_coordinator(hass, call)
+    await coordinator.async_write_raw(call.data["address"], call.data["value"])
+
+
+async def _async_start_capture(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Start capturing raw bus traffic."""
+    buses = _get_buses(hass, call)
+    if "path" in call.data and len(buses) > 1:
+        raise HomeAssistantError("A capture path can only be given together with a port")
+
+    for bus in buses:
+        path = call.data.get("path") or hass.config.path(f"{DOMAIN}_{slugify(bus.port)}.lxcap")
+        if not hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Writing to {path} is not allowed")
+        async with bus.lock:
+            await hass.async_add_executor_job(
+                bus.start_capture, path, call.data["max_bytes"], call.data["backup_count"]
+            )
+        _LOGGER.info("Capturing traffic on %s to %s", bus.port, path)
+
+
+async def _async_stop_capture(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Stop capturing raw bus traffic."""
+    for bus in _get_buses(hass, call):
+        async with bus.lock:
+            await hass.async_add_executor_job(bus.stop_capture)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services, once for all config entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_START_CAPTURE):
+        return
+
+    async def start_capture(call: ServiceCall) -> None:
+        await _async_start_capture(hass, call)
+
+    async def stop_capture(call: ServiceCall) -> None:
+        await _async_stop_capture(hass, call)
+
+    async def read_registers(call: ServiceCall) -> ServiceResponse:
+        return await _async_read_registers(hass, call)
+
+    async def write_register(call: ServiceCall) -> None:
+        await _async_write_register(hass, call)
+
+    hass.services.async_register(DOMAIN, SERVICE_START_CAPTURE, start_capture, schema=START_CAPTURE_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_STOP_CAPTURE, stop_capture, schema=STOP_CAPTURE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_READ_REGISTERS,
+        read_registers,
+        schema=READ_REGISTERS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(DOMAIN, SERVICE_WRITE_REGISTER, write_register, schema=WRITE_REGISTER_SCHEMA)
@@ -9,8 +9,9 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, HOLDING_REGISTERS_SWITCHES
-from . import LuxpowerModbusDataCoordinator
+from .const import DOMAIN
+from . import LuxpowerModbusDataCoordinator, entry_device_key
+from .register_groups import switch_descriptions
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = [
         LuxpowerModbusSwitch(coordinator, entry, description)
-        for description in HOLDING_REGISTERS_SWITCHES
+        for description in switch_descriptions()
     ]
     async_add_entities(entities)
 
@@ -35,22 +36,23 @@ class LuxpowerModbusSwitch(CoordinatorEntity[LuxpowerModbusDataCoordinator], Swi
         """Initialize the switch."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{DOMAIN}_{config_entry.data['slave_id']}_{description.key}"
+        device_key = entry_device_key(config_entry)
+        self._attr_unique_id = f"{DOMAIN}_{device_key}_{description.key}"
         self._attr_is_on = None
 
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.data['slave_id'])},
-            name=f"Luxpower Inverter (Slave {config_entry.data['slave_id']})",
+            identifiers={(DOMAIN, device_key)},
+            name=f"Luxpower Inverter (Slave {coordinator.slave_id})",
             manufacturer="Luxpower",
         )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        register_key = f"register_{self.entity_description.register_address}"
-        if self.coordinator.data and register_key in self.coordinator.data:
-            register_val = self.coordinator.data[register_key]
-            self._attr_is_on = bool(int(register_val) & (1 << self.entity_description.bit))
+        if self.coordinator.data:
+            register_val = self.coordinator.data.holding.word(self.entity_description.register_address)
+            if register_val is not None:
+                self._attr_is_on = bool(register_val & (1 << self.entity_description.bit))
         self.async_write_ha_state()
 
     async def _async_set_bit(self, state: bool) -> None:
@@ -0,0 +1,322 @@
+"""Modbus transport helpers for the Luxpower Modbus RTU integration.
+
+Besides creating the serial client, this module can capture bus traffic to a
+compact binary log and replay such a log in place of the serial port, so that
+decoding can be profiled and regression-tested without an inverter.
+
+A capture file starts with ``CAPTURE_MAGIC`` followed by records of
+``CAPTURE_RECORD`` (timestamp, direction, slave ID, PDU length) and the Modbus
+PDU itself (function code and data, without slave address or CRC). A response
+with an empty PDU means no response was received.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+import logging
+import os
+import struct
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from pymodbus.client import ModbusSerialClient
+
+_LOGGER = logging.getLogger(__name__)
+
+REPLAY_SCHEME = "replay://"
+
+CAPTURE_MAGIC = b"LXMBCAP\x01"
+CAPTURE_RECORD = struct.Struct("<dBBH")
+DIRECTION_REQUEST = 0
+DIRECTION_RESPONSE = 1
+
+DEFAULT_CAPTURE_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_CAPTURE_BACKUP_COUNT = 3
+
+FC_READ_HOLDING = 0x03
+FC_READ_INPUT = 0x04
+FC_WRITE_SINGLE = 0x06
+
+
+def _replay_options(port: str) -> tuple[str, float, bool]:
+    """Split a ``replay://`` port into capture path, speed and loop flag."""
+    url = urlparse(port)
+    params = parse_qs(url.query)
+    return (
+        url.netloc + url.path,
+        float(params.get("speed", ["1"])[0]),
+        params.get("loop", ["0"])[0] in ("1", "true"),
+    )
+
+
+def time_scale(port: str) -> float:
+    """Return how many times faster than real time traffic on a port runs.
+
+    This is the replay speed for ``replay://`` ports, so polls keep up with the
+    paced responses, and 1 otherwise, including for unpaced replays (speed 0).
+    """
+    if port.startswith(REPLAY_SCHEME) and (speed := _replay_options(port)[1]) > 0:
+        return speed
+    return 1.0
+
+
+def create_client(port: str, baudrate: int) -> Any:
+    """Return the client for a port, replaying a capture for ``replay://`` ports."""
+    if port.startswith(REPLAY_SCHEME):
+        path, speed, loop = _replay_options(port)
+        return ReplayModbusClient(path, speed=speed, loop=loop)
+    return ModbusSerialClient(
+        port=port,
+        baudrate=baudrate,
+        stopbits=1,
+        bytesize=8,
+        parity="N",
+        timeout=3,
+    )
+
+
+def _request_pdu(function_code: int, address: int, value: int) -> bytes:
+    return struct.pack(">BHH", function_code, address, value)
+
+
+def _response_pdu(request_pdu: bytes, result: Any) -> bytes:
+    function_code = request_pdu[0]
+    if result is None:
+        return b""
+    if result.isError():
+        return struct.pack(">BB", function_code | 0x80, getattr(result, "exception_code", 0) or 0)
+    if function_code == FC_WRITE_SINGLE:
+        return request_pdu  # A successful write echoes the request
+    registers = result.registers
+    return struct.pack(f">BB{len(registers)}H", function_code, 2 * len(registers), *registers)
+
+
+class CaptureWriter:
+    """Append capture records to a file, rotating it once it grows past ``max_bytes``."""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_CAPTURE_MAX_BYTES,
+        backup_count: int = DEFAULT_CAPTURE_BACKUP_COUNT,
+    ) -> None:
+        """Initialize and open the capture file."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._file = self._open()
+
+    def _open(self):
+        file = open(self.path, "ab")  # noqa: SIM115
+        if file.tell() == 0:
+            file.write(CAPTURE_MAGIC)
+        return file
+
+    def _rotate(self) -> None:
+        self._file.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = self._open()
+
+    def write(self, direction: int, slave: int, pdu: bytes) -> None:
+        """Write one frame."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(CAPTURE_RECORD.pack(time.time(), direction, slave, len(pdu)) + pdu)
+            if self._file.tell() >= self.max_bytes:
+                self._rotate()
+
+    def close(self) -> None:
+        """Flush and close the capture file."""
+        with self._lock:
+            self._file.close()
+
+
+@dataclass
+class CaptureRecord:
+    """A single frame read back from a capture file."""
+
+    timestamp: float
+    direction: int
+    slave: int
+    pdu: bytes
+
+
+def read_capture(path: str) -> Iterator[CaptureRecord]:
+    """Iterate over the frames in a capture file."""
+    with open(path, "rb") as file:
+        if file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f"{path} is not a Luxpower Modbus capture")
+        while header := file.read(CAPTURE_RECORD.size):
+            if len(header) < CAPTURE_RECORD.size:
+                break  # Truncated by a crash while writing
+            timestamp, direction, slave, length = CAPTURE_RECORD.unpack(header)
+            pdu = file.read(length)
+            if len(pdu) < length:
+                break
+            yield CaptureRecord(timestamp, direction, slave, pdu)
+
+
+class CapturingModbusClient:
+    """Wrap a client and write every request and response to a ``CaptureWriter``."""
+
+    def __init__(self, client: Any, writer: CaptureWriter) -> None:
+        """Initialize."""
+        self.client = client
+        self.writer = writer
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def _transaction(self, function_code: int, address: int, value: int, slave: int, call) -> Any:
+        request_pdu = _request_pdu(function_code, address, value)
+        self.writer.write(DIRECTION_REQUEST, slave, request_pdu)
+        result = None
+        try:
+            result = call()
+            return result
+        finally:
+            self.writer.write(DIRECTION_RESPONSE, slave, _response_pdu(request_pdu, result))
+
+    def read_input_registers(self, address: int, count: int = 1, slave: int = 1, **kwargs: Any) -> Any:
+        """Read input registers."""
+        return self._transaction(
+            FC_READ_INPUT, address, count, slave,
+            lambda: self.client.read_input_registers(address, count, slave=slave, **kwargs),
+        )
+
+    def read_holding_registers(self, address: int, count: int = 1, slave: int = 1, **kwargs: Any) -> Any:
+        """Read holding registers."""
+        return self._transaction(
+            FC_READ_HOLDING, address, count, slave,
+            lambda: self.client.read_holding_registers(address, count, slave=slave, **kwargs),
+        )
+
+    def write_register(self, address: int, value: int, slave: int = 1, **kwargs: Any) -> Any:
+        """Write a single holding register."""
+        return self._transaction(
+            FC_WRITE_SINGLE, address, value, slave,
+            lambda: self.client.write_register(address, value, slave=slave, **kwargs),
+        )
+
+
+class ReplayResponse:
+    """A response decoded from a capture, mimicking the pymodbus response API."""
+
+    def __init__(self, pdu: bytes) -> None:
+        """Initialize."""
+        self.function_code = pdu[0] if pdu else 0x80
+        self.exception_code = pdu[1] if len(pdu) > 1 and self.function_code & 0x80 else 0
+        self.address = 0
+        self.registers: list[int] = []
+        if self.function_code in (FC_READ_HOLDING, FC_READ_INPUT):
+            self.registers = list(struct.unpack(f">{pdu[1] // 2}H", pdu[2:2 + pdu[1]]))
+        elif self.function_code == FC_WRITE_SINGLE:
+            self.address, value = struct.unpack(">HH", pdu[1:5])
+            self.registers = [value]
+
+    def isError(self) -> bool:  # noqa: N802
+        """Return True for exception or missing responses."""
+        return bool(self.function_code & 0x80)
+
+    def __repr__(self) -> str:
+        return f"ReplayResponse(function_code={self.function_code}, exception_code={self.exception_code})"
+
+
+class ReplayModbusClient:
+    """Serve responses from a capture file in place of the serial port.
+
+    Each request is answered with the response recorded for the next matching
+    request in the capture. Responses are paced like the original traffic divided
+    by ``speed``; a speed of 0 answers without delay. Pacing can only hold a
+    response back, so the bus polls a replay ``speed`` times as often as well,
+    see ``time_scale``.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0, loop: bool = False) -> None:
+        """Initialize."""
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self._transactions: list[tuple[CaptureRecord, CaptureRecord]] | None = None
+        self._position = 0
+        self._connected = False
+        self._origin: tuple[float, float] | None = None
+
+    def connect(self) -> bool:
+        """Load the capture on first use."""
+        if self._transactions is None:
+            try:
+                records = list(read_capture(self.path))
+            except (OSError, ValueError) as e:
+                _LOGGER.error("Cannot load capture %s: %s", self.path, e)
+                return False
+            self._transactions = []
+            pending: CaptureRecord | None = None
+            for record in records:
+                if record.direction == DIRECTION_REQUEST:
+                    pending = record
+                elif pending is not None:
+                    self._transactions.append((pending, record))
+                    pending = None
+        self._connected = True
+        return True
+
+    def close(self) -> None:
+        """Close the replay."""
+        self._connected = False
+
+    def is_socket_open(self) -> bool:
+        """Return whether connect() has been called."""
+        return self._connected
+
+    def _pace(self, timestamp: float) -> None:
+        if self.speed <= 0:
+            return
+        if self._origin is None:
+            self._origin = (time.monotonic(), timestamp)
+        wall_start, capture_start = self._origin
+        delay = wall_start + (timestamp - capture_start) / self.speed - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _transaction(self, request_pdu: bytes, slave: int) -> ReplayResponse:
+        if not self._connected:
+            return ReplayResponse(b"")
+        count = len(self._transactions)
+        for step in range(count):
+            index = self._position + step
+            if index >= count:
+                if not self.loop:
+                    break
+                index -= count
+            request, response = self._transactions[index]
+            if request.pdu == request_pdu and request.slave == slave:
+                if index < self._position:
+                    self._origin = None  # Wrapped around, restart pacing
+                self._position = index + 1
+                self._pace(response.timestamp)
+                return ReplayResponse(response.pdu)
+        _LOGGER.debug("No recorded response left for request %s to slave %s", request_pdu.hex(), slave)
+        return ReplayResponse(b"")
+
+    def read_input_registers(self, address: int, count: int = 1, slave: int = 1, **kwargs: Any) -> ReplayResponse:
+        """Replay an input register read."""
+        return self._transaction(_request_pdu(FC_READ_INPUT, address, count), slave)
+
+    def read_holding_registers(self, address: int, count: int = 1, slave: int = 1, **kwargs: Any) -> ReplayResponse:
+        """Replay a holding register read."""
+        return self._transaction(_request_pdu(FC_READ_HOLDING, address, count), slave)
+
+    def write_register(self, address: int, value: int, slave: int = 1, **kwargs: Any) -> ReplayResponse:
+        """Acknowledge a write without changing the replayed registers."""
+        return ReplayResponse(_request_pdu(FC_WRITE_SINGLE, address, value))
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Compile the register tables of the protocol document into register_map.py.
+
+Usage:
+    python scripts/generate_register_map.py          # regenerate the table
+    python scripts/generate_register_map.py --check  # also report const.py entries that disagree with the document
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+from difflib import SequenceMatcher
+from pathlib import Path
+import re
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+PROTOCOL_DOC = ROOT / "modbus_protocol_updated_on_2025.06.14.md"
+COMPONENT = ROOT / "custom_components" / "luxpower_modbus"
+OUTPUT = COMPONENT / "register_map.py"
+CONST = COMPONENT / "const.py"
+
+SECTIONS = {
+    "### 2.1 Input Registers": "INPUT_REGISTER_MAP",
+    "### 2.2 Hold Registers": "HOLDING_REGISTER_MAP",
+}
+
+# Units as written in the document, normalized to Home Assistant units
+UNIT_ALIASES = {
+    "sec": "s",
+    "Var": "var",
+    "Day": "d",
+    "Hour": "h",
+    "%o/min": "‰/min",
+}
+# Unit cells that are not units at all
+NOT_UNITS = {"BitMap", "ASCII", "2Bits", "0.1V/0.01Hz"}
+
+_UNIT_RE = re.compile(r"^(\d+(?:\.\d+)?)?\s*(.*)$")
+_LOW_WORD_RE = re.compile(r"^(.*\S)\s+L$|^(.*_all)L$")
+_BIT_RE = re.compile(r"^Bits?\s*(\d+)(?:\s*-\s*(\d+))?\s*:?\s*(.*)$")
+
+# Quantities a register can measure, with the words that name them, used to
+# catch curated entities whose name no longer matches the document
+QUANTITY_WORDS = {
+    "voltage": {"voltage", "volt"},
+    "current": {"current", "curr", "rms"},
+    "power": {"power", "pwr", "energy", "generation", "export", "import", "load"},
+    "frequency": {"frequency", "freq"},
+    "temperature": {"temperature", "temp"},
+    "capacity": {"capacity"},
+    "soc": {"soc"},
+    "soh": {"soh", "health"},
+    "percentage": {"percentage", "percent"},
+}
+
+# Curated entities reviewed against the document and kept as they are, with the reason
+REVIEWED_EXCEPTIONS = {
+    "power_from_grid_r": "Ptouser is the grid import power; its S and T phase registers"
+    " (186, 187) are documented as grid supply power, so 'Grid power capacity' is a doc error",
+}
+
+
+def _parse_rows(lines: list[str]) -> list[list[str]]:
+    """Return the cells of the table rows following a section heading."""
+    rows = []
+    for line in lines:
+        if line.startswith("###") or line.startswith("---"):
+            if rows:
+                break
+            continue
+        if not line.startswith("|") or line.startswith("|:") or line.startswith("| Addr"):
+            continue
+        rows.append([cell.strip() for cell in line.strip().strip("|").split("|")])
+    return rows
+
+
+def _parse_unit(cell: str) -> tuple[float, str]:
+    """Split a unit cell such as '0.1kWh' into scale and unit."""
+    if cell in NOT_UNITS or re.fullmatch(r"\d+-\d+", cell):
+        return 1.0, ""
+    scale, unit = _UNIT_RE.match(cell).groups()
+    return float(scale) if scale else 1.0, UNIT_ALIASES.get(unit, unit)
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")
+
+
+def _parse_bitfields(note: str) -> tuple[tuple[int, int, str], ...]:
+    """Extract (first bit, last bit, name) tuples from a note like 'Bit0-1: Role; Bit2: Flag'."""
+    note = note.replace("**", "").replace("<br>", " ")
+    fields = []
+    seen = set()
+    for segment in re.split(r"[;,]?\s*(?=Bits?\s*\d)", note):
+        if not (match := _BIT_RE.match(segment.strip())):
+            continue
+        first = int(match.group(1))
+        last = min(int(match.group(2) or first), 15)
+        name = _slug(re.split(r"[(:;,]", match.group(3))[0])
+        if not name or name[0].isdigit():  # Value list instead of a name, e.g. '1:Master, 2:Slave'
+            name = f"bit{first}" if first == last else f"bits{first}_{last}"
+        if name in seen:
+            name = f"{name}_bit{first}"
+        seen.add(name)
+        fields.append((first, last, name))
+    return tuple(fields)
+
+
+def _clean(text: str) -> str:
+    text = text.replace("**", "").replace("<br>", " ")
+    text = re.sub(r"\s*\((Low|High)( byte)?[^)]*\)", "", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def compile_table(rows: list[list[str]]) -> list[tuple]:
+    """Compile table rows into (address, width, scale, signed, unit, item, description, bitfields)."""
+    by_address: dict[int, list[str]] = {}
+    for cells in rows:
+        cells = (cells + [""] * 5)[:5]
+        if cells[0].isdigit() and int(cells[0]) not in by_address:
+            by_address[int(cells[0])] = cells
+
+    table = []
+    skip = set()
+    for address, (_, item, unit_cell, range_cell, note) in sorted(by_address.items()):
+        if address in skip or note.lower().startswith("reserved"):
+            continue
+        width = 1
+        if (low := _LOW_WORD_RE.match(item)) and (high := by_address.get(address + 1)):
+            base = low.group(1) or low.group(2)
+            if re.fullmatch(rf"{re.escape(base)}\s*H", high[1]):
+                width = 2
+                skip.add(address + 1)
+                item = base
+        scale, unit = _parse_unit(unit_cell)
+        signed = "signed" in note.lower() or "+/-" in range_cell
+        bitfields = _parse_bitfields(note) if "Bit" in note else ()
+        table.append((address, width, scale, signed, unit, item, _clean(note) or item, bitfields))
+    return table
+
+
+def render(tables: dict[str, list[tuple]]) -> str:
+    """Render the generated module."""
+    out = [
+        f'"""Register map compiled from {PROTOCOL_DOC.name}.',
+        "",
+        "Generated by scripts/generate_register_map.py, do not edit by hand.",
+        "Rows are (address, width, scale, signed, unit, item, description, bitfields),",
+        "with bitfields as (first bit, last bit, name) tuples.",
+        '"""',
+    ]
+    for name, table in tables.items():
+        out += ["", f"{name} = ("]
+        out += [f"    {row!r}," for row in table]
+        out.append(")")
+    return "\n".join(out) + "\n"
+
+
+def _curated_entities() -> dict[str, dict]:
+    """Return the curated entity tables of const.py, read without importing Home Assistant."""
+    return {
+        node.target.id: ast.literal_eval(node.value)
+        for node in ast.parse(CONST.read_text()).body
+        if isinstance(node, ast.AnnAssign) and node.target.id.endswith("_ENTITIES")
+    }
+
+
+def _quantities(text: str) -> set[str]:
+    """Return the quantities named in a text such as 'Grid power capacity (R phase)'."""
+    words = set(re.findall(r"[a-z]+", re.sub(r"([a-z])([A-Z])", r"\1 \2", text).lower()))
+    return {quantity for quantity, names in QUANTITY_WORDS.items() if words & names}
+
+
+def _compact(text: str) -> str:
+    return re.sub(r"[^a-z]", "", text.lower())
+
+
+def check_const(tables: dict[str, list[tuple]]) -> list[str]:
+    """Compare the curated entity tables in const.py with the document.
+
+    Reports registers missing from the document, switches whose bit is not the
+    documented flag of the same name, byte sensors on registers not documented as
+    two values, and entities whose document description names a quantity their
+    own name does not, e.g. 'Grid power capacity' for a 'Power from Grid' sensor.
+    Entities in ``REVIEWED_EXCEPTIONS`` are only checked for their register.
+    """
+    rows = {
+        (name, row[0]): row for name, table in tables.items() for row in table
+    }
+    problems = []
+    for entities_name, entities in _curated_entities().items():
+        table = "INPUT_REGISTER_MAP" if entities_name.startswith("INPUT") else "HOLDING_REGISTER_MAP"
+        for register, (key, name, *_) in entities.items():
+            address = register[0] if isinstance(register, tuple) else register
+            if (table, address) not in rows:
+                problems.append(f"{key}: register {address} is not in the {table} of the document")
+                continue
+            if key in REVIEWED_EXCEPTIONS:
+                continue
+            _, _, _, _, _, item, description, bitfields = rows[table, address]
+            if entities_name == "HOLDING_SWITCH_ENTITIES":
+                bit = register[1]
+                field = next((field for first, last, field in bitfields if first <= bit <= last), None)
+                if field is None:
+                    problems.append(f"{key}: bit {bit} of register {address} ({item}) is not documented")
+                    continue
+                match = SequenceMatcher(None, _compact(field), _compact(f"{key}{name}")).find_longest_match()
+                if match.size < 4:
+                    problems.append(f"{key}: bit {bit} of register {address} is '{field}' in the document")
+            elif isinstance(register, tuple):
+                # Byte sensors: the item names the low and high byte, e.g. 'SOC / SOH'
+                parts = re.split(r"\s*/\s*", item)
+                if len(parts) != 2:
+                    problems.append(f"{key}: register {address} ({item}) is not documented as two byte values")
+                elif missing := _quantities(parts[register[1] // 8]) - _quantities(f"{key} {name}"):
+                    problems.append(
+                        f"{key}: byte {register[1] // 8} of register {address} is '{parts[register[1] // 8]}'"
+                        f" in the document, which names {', '.join(sorted(missing))} but '{name}' does not"
+                    )
+            elif not bitfields and (missing := _quantities(description) - _quantities(f"{key} {name}")):
+                problems.append(
+                    f"{key}: register {address} is '{item}' ({description}) in the document,"
+                    f" which names {', '.join(sorted(missing))} but '{name}' does not"
+                )
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="report const.py entries that disagree with the document")
+    args = parser.parse_args()
+
+    lines = PROTOCOL_DOC.read_text(encoding="utf-8").splitlines()
+    tables = {}
+    for heading, name in SECTIONS.items():
+        start = next(i for i, line in enumerate(lines) if line.startswith(heading))
+        tables[name] = compile_table(_parse_rows(lines[start + 1:]))
+    OUTPUT.write_text(render(tables), encoding="utf-8")
+    print(f"Wrote {OUTPUT.relative_to(ROOT)}: " + ", ".join(f"{len(t)} {n}" for n, t in tables.items()))
+
+    if args.check:
+        problems = check_const(tables)
+        for problem in problems:
+            print(problem)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())